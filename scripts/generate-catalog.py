@@ -3,23 +3,72 @@
 Generate CATALOG.md from marketplace.json and plugin manifests.
 
 Usage:
-  python scripts/generate-catalog.py          # Generate CATALOG.md
-  python scripts/generate-catalog.py --check  # Check if CATALOG.md is up to date (CI mode)
+  python scripts/generate-catalog.py            # Generate CATALOG.md
+  python scripts/generate-catalog.py --check    # Check if CATALOG.md is up to date (CI mode)
+  python scripts/generate-catalog.py --jobs 32  # Number of concurrent repo fetches
+  python scripts/generate-catalog.py --timestamp  # Include a "Generated:" line (not for CI)
 """
+import argparse
+import hashlib
 import json
 import os
 import shutil
 import subprocess
 import sys
-from dataclasses import dataclass
-from datetime import datetime
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Protocol, Set, Tuple
+
+try:
+    # Optional C-accelerated parser; stdlib json is the fallback
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 ROOT = Path(__file__).resolve().parents[1]
 MARKETPLACE_FILE = ROOT / ".claude-plugin" / "marketplace.json"
 CATALOG_FILE = ROOT / "CATALOG.md"
-TMP_DIR = ROOT / ".tmp_catalog_gen"
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "juni-tools-marketplace"
+REPO_CACHE_DIR = CACHE_DIR / "repos"
+MANIFEST_CACHE_DIR = CACHE_DIR / "manifests"
+CACHE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+DEFAULT_JOBS = min(16, (os.cpu_count() or 1) * 2)
+FETCH_TIMEOUT_SECONDS = 10
+GIT_TIMEOUT_SECONDS = 60
+
+# Never let git block on a credential prompt: a private or mistyped URL
+# would otherwise hang its worker (and the whole run) indefinitely
+GIT_ENV = {**os.environ, "GIT_TERMINAL_PROMPT": "0", "GIT_ASKPASS": "/bin/true"}
+
+# Badge markdown only has a handful of distinct values; build them once
+_TIER_BADGES = {
+    "curated": "![Curated](https://img.shields.io/badge/Tier-Curated-7c3aed)",
+    "community": "![Community](https://img.shields.io/badge/Tier-Community-blue)",
+}
+_NETWORK_BADGES = {
+    "none": "![None](https://img.shields.io/badge/Network-None-success)",
+    "allowlist": "![Allowlist](https://img.shields.io/badge/Network-Allowlist-yellow)",
+}
+_NETWORK_UNKNOWN_BADGE = "![Unknown](https://img.shields.io/badge/Network-Unknown-gray)"
+_RISK_BADGES = {
+    egress: f"![Risk: {egress}](https://img.shields.io/badge/Risk-{egress}-{color})"
+    for egress, color in {"low": "success", "medium": "yellow", "high": "red"}.items()
+}
+
+FINGERPRINT_PREFIX = "<!-- fingerprint: "
+FINGERPRINT_SUFFIX = " -->"
+GENERATED_PREFIX = b"**Generated:** "
+
+MANIFEST_PATHS = ["plugin.json", ".claude-plugin/plugin.json"]
+GITHUB_PREFIX = "https://github.com/"
+GITHUB_RAW_BASE = "https://raw.githubusercontent.com"
 
 
 @dataclass
@@ -41,32 +90,266 @@ class PluginInfo:
     risk_notes: Optional[str] = None
 
 
-def run(cmd: List[str], cwd: Optional[Path] = None) -> tuple:
-    p = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+@dataclass
+class FetchResult:
+    plugin: dict
+    data: Optional[bytes] = None  # raw manifest; None if absent or unavailable
+    repo_path: Optional[Path] = None  # cached clone still to be read
+    log: List[str] = field(default_factory=list)
+
+
+class Sink(Protocol):
+    def write(self, s: str) -> int: ...
+
+
+class Utf8FileSink:
+    """
+    Text sink that encodes into a single bytearray and hands it to os.write()
+    in large chunks: one syscall for a typical catalog, bounded memory for
+    a huge one. Always writes LF line endings.
+    """
+
+    def __init__(self, fd: int, flush_at: int = 1 << 20):
+        self.fd = fd
+        self.flush_at = flush_at
+        self.buf = bytearray()
+
+    def write(self, s: str) -> int:
+        self.buf += s.encode("utf-8")
+        if len(self.buf) >= self.flush_at:
+            self.flush()
+        return len(s)
+
+    def flush(self) -> None:
+        with memoryview(self.buf) as view:
+            written = 0
+            while written < len(view):
+                written += os.write(self.fd, view[written:])
+        self.buf.clear()
+
+
+class HashingSink:
+    """Text sink that feeds everything written into a blake2b hash."""
+
+    def __init__(self):
+        self.hash = hashlib.blake2b()
+
+    def write(self, s: str) -> int:
+        self.hash.update(s.encode("utf-8"))
+        return len(s)
+
+    def digest(self) -> bytes:
+        return self.hash.digest()
+
+
+def run(cmd: List[str], cwd: Optional[Path] = None, capture: bool = True) -> tuple:
+    """Run cmd; with capture=False its output goes to /dev/null and "" is returned."""
+    stream = subprocess.PIPE if capture else subprocess.DEVNULL
+    try:
+        p = subprocess.run(
+            cmd, cwd=cwd, stdout=stream, stderr=stream, text=capture,
+            env=GIT_ENV, timeout=GIT_TIMEOUT_SECONDS
+        )
+    except subprocess.TimeoutExpired:
+        return 1, f"Timed out after {GIT_TIMEOUT_SECONDS}s: {' '.join(cmd)}"
     return p.returncode, (p.stdout or "") + (p.stderr or "")
 
 
 def clone_repo(url: str, dest: Path) -> bool:
+    """
+    Partial clone that only downloads trees plus the manifest blobs: no
+    history, no other file contents.
+    """
     if dest.exists():
         shutil.rmtree(dest)
-    code, _ = run(["git", "clone", "--depth", "1", url, str(dest)])
-    return code == 0
+    steps = [
+        ["git", "clone", "-q", "--depth", "1", "--filter=blob:none", "--no-checkout", url, str(dest)],
+        ["git", "-C", str(dest), "sparse-checkout", "set", "--no-cone", *(f"/{p}" for p in MANIFEST_PATHS)],
+        ["git", "-C", str(dest), "checkout", "-q"],
+    ]
+    for cmd in steps:
+        code, _ = run(cmd, capture=False)
+        if code != 0:
+            return False
+    return True
+
+
+def remote_head(url: str) -> Optional[str]:
+    """Resolve the remote HEAD commit SHA without fetching any objects."""
+    code, out = run(["git", "ls-remote", url, "HEAD"])
+    if code != 0 or not out.strip():
+        return None
+    return out.split()[0]
+
+
+def remote_heads(urls: List[str], jobs: int = DEFAULT_JOBS) -> Dict[str, Optional[str]]:
+    """Resolve remote HEAD SHAs for many URLs concurrently."""
+    unique = sorted(set(urls))
+    if not unique:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(jobs, len(unique))) as ex:
+        return dict(zip(unique, ex.map(remote_head, unique)))
+
+
+def cached_repo(url: str, sha: Optional[str] = None) -> Optional[Path]:
+    """
+    Return a clone of the remote HEAD, reusing REPO_CACHE_DIR/<sha> when
+    the remote has not moved since the last run.
+    """
+    sha = sha or remote_head(url)
+    if not sha:
+        return None
+
+    cached = REPO_CACHE_DIR / sha
+    if cached.is_dir():
+        os.utime(cached)  # keep recently used entries out of gc_cache()
+        return cached
+
+    REPO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(prefix=f"{sha}.", suffix=".tmp", dir=REPO_CACHE_DIR))
+    try:
+        if not clone_repo(url, tmp):
+            return None
+        # HEAD may have moved since ls-remote; key the entry by what we got
+        code, out = run(["git", "rev-parse", "HEAD"], cwd=tmp)
+        if code == 0 and out.strip():
+            cached = REPO_CACHE_DIR / out.strip()
+        try:
+            tmp.rename(cached)
+        except OSError:
+            # Another worker populated the same SHA first
+            if not cached.is_dir():
+                raise
+        return cached
+    finally:
+        if tmp.exists():
+            shutil.rmtree(tmp, ignore_errors=True)
 
 
-def load_marketplace() -> dict:
-    with MARKETPLACE_FILE.open("r", encoding="utf-8") as f:
-        return json.load(f)
+def load_cached_manifest(sha: str) -> Optional[bytes]:
+    """
+    Return the manifest recorded for commit sha: b"" if that commit has no
+    manifest, or None if it has not been seen before.
+    """
+    entry = MANIFEST_CACHE_DIR / sha
+    try:
+        data = entry.read_bytes()
+    except OSError:
+        return None
+    os.utime(entry)
+    return data
+
+
+def store_cached_manifest(sha: str, data: Optional[bytes]) -> None:
+    """Record the manifest for commit sha. Commits are immutable, so it never goes stale."""
+    MANIFEST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f"{sha}.", suffix=".tmp", dir=MANIFEST_CACHE_DIR)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data or b"")
+    os.replace(tmp, MANIFEST_CACHE_DIR / sha)
+
+
+def gc_cache() -> None:
+    """Drop cache entries that have not been used for CACHE_MAX_AGE_SECONDS."""
+    cutoff = time.time() - CACHE_MAX_AGE_SECONDS
+    for cache_dir in (REPO_CACHE_DIR, MANIFEST_CACHE_DIR):
+        if not cache_dir.is_dir():
+            continue
+        for entry in cache_dir.iterdir():
+            try:
+                if entry.stat().st_mtime >= cutoff:
+                    continue
+                if entry.is_dir():
+                    shutil.rmtree(entry, ignore_errors=True)
+                else:
+                    entry.unlink()
+            except OSError:
+                continue
 
 
-def find_manifest(repo_path: Path) -> Optional[Path]:
-    for p in ["plugin.json", ".claude-plugin/plugin.json"]:
-        manifest = repo_path / p
-        if manifest.exists():
-            return manifest
+def load_marketplace() -> dict:
+    return json_loads(MARKETPLACE_FILE.read_bytes())
+
+
+def github_repo(url: str) -> Optional[Tuple[str, str]]:
+    """Return (owner, repo) for a github.com URL, or None for other hosts."""
+    if not url.startswith(GITHUB_PREFIX):
+        return None
+    parts = url[len(GITHUB_PREFIX):].rstrip("/").split("/")
+    if len(parts) != 2 or not all(parts):
+        return None
+    owner, repo = parts
+    if repo.endswith(".git"):
+        repo = repo[:-4]
+    return owner, repo
+
+
+def fetch_manifest(url: str, ref: str = "HEAD") -> Optional[bytes]:
+    """
+    Fetch a plugin manifest straight from raw.githubusercontent.com.
+    Returns None when the repo has no manifest; raises on network errors.
+    """
+    owner, repo = github_repo(url)
+    for p in MANIFEST_PATHS:
+        raw_url = f"{GITHUB_RAW_BASE}/{owner}/{repo}/{ref}/{p}"
+        try:
+            with urllib.request.urlopen(raw_url, timeout=FETCH_TIMEOUT_SECONDS) as resp:
+                return resp.read()
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                continue
+            raise
     return None
 
 
-def extract_plugin_info(plugin: dict, repo_path: Optional[Path]) -> PluginInfo:
+def read_manifests(repos: List[Path]) -> List[Optional[bytes]]:
+    """
+    Read the manifest at HEAD of each cached clone.
+
+    All lookups go through a single `git cat-file --batch` process running in
+    a scratch repo whose alternates point at every clone, instead of one git
+    process (or checkout) per plugin.
+    """
+    if not repos:
+        return []
+
+    REPO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    reader = Path(tempfile.mkdtemp(prefix="reader.", dir=REPO_CACHE_DIR))
+    try:
+        # Empty template: skip the sample hooks so teardown is a few unlinks
+        run(["git", "init", "--bare", "-q", "--template=", str(reader)], capture=False)
+        alternates = reader / "objects" / "info" / "alternates"
+        alternates.write_text("".join(f"{r / '.git' / 'objects'}\n" for r in repos), encoding="utf-8")
+
+        proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=reader, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+        )
+        manifests: List[Optional[bytes]] = []
+        try:
+            for repo in repos:
+                sha = repo.name
+                data = None
+                for p in MANIFEST_PATHS:
+                    proc.stdin.write(f"{sha}:{p}\n".encode())
+                    proc.stdin.flush()
+                    # "<oid> <type> <size>" followed by contents, or "<name> missing"
+                    header = proc.stdout.readline().split()
+                    if len(header) != 3:
+                        continue
+                    data = proc.stdout.read(int(header[2]))
+                    proc.stdout.read(1)  # trailing newline
+                    break
+                manifests.append(data)
+        finally:
+            proc.stdin.close()
+            proc.wait()
+        return manifests
+    finally:
+        shutil.rmtree(reader, ignore_errors=True)
+
+
+def extract_plugin_info(plugin: dict, manifest: Optional[dict]) -> PluginInfo:
     """Extract plugin info from marketplace entry and manifest."""
 
     # Basic info from marketplace entry
@@ -82,202 +365,342 @@ def extract_plugin_info(plugin: dict, repo_path: Optional[Path]) -> PluginInfo:
         tags=plugin.get("tags", []),
     )
 
-    # Try to read manifest from cloned repo
-    if repo_path:
-        manifest_path = find_manifest(repo_path)
-        if manifest_path:
-            try:
-                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
-
-                info.version = manifest.get("version")
-
-                caps = manifest.get("capabilities", {})
+    if manifest:
+        info.version = manifest.get("version")
 
-                # Network
-                network = caps.get("network", {})
-                info.network_mode = network.get("mode", "none")
-                info.network_domains = network.get("domains", [])
+        caps = manifest.get("capabilities", {})
 
-                # Filesystem
-                fs = caps.get("filesystem", {})
-                info.fs_read = fs.get("read", [])
-                info.fs_write = fs.get("write", [])
+        # Network
+        network = caps.get("network", {})
+        info.network_mode = network.get("mode", "none")
+        info.network_domains = network.get("domains", [])
 
-                # Commands
-                cmds = caps.get("commands", {})
-                info.commands_allow = cmds.get("allow", [])
-                info.commands_deny = cmds.get("deny", [])
+        # Filesystem
+        fs = caps.get("filesystem", {})
+        info.fs_read = fs.get("read", [])
+        info.fs_write = fs.get("write", [])
 
-                # Secrets
-                secrets = caps.get("secrets", {})
-                info.secrets_required = secrets.get("required", [])
+        # Commands
+        cmds = caps.get("commands", {})
+        info.commands_allow = cmds.get("allow", [])
+        info.commands_deny = cmds.get("deny", [])
 
-                # Risk
-                risk = manifest.get("risk", {})
-                info.risk_egress = risk.get("dataEgress")
-                info.risk_notes = risk.get("notes")
+        # Secrets
+        secrets = caps.get("secrets", {})
+        info.secrets_required = secrets.get("required", [])
 
-            except Exception as e:
-                print(f"  Warning: Could not read manifest: {e}")
+        # Risk
+        risk = manifest.get("risk", {})
+        info.risk_egress = risk.get("dataEgress")
+        info.risk_notes = risk.get("notes")
 
     return info
 
 
 def network_badge(info: PluginInfo) -> str:
     """Generate network badge markdown."""
-    if info.network_mode == "none":
-        return "![None](https://img.shields.io/badge/Network-None-success)"
-    elif info.network_mode == "allowlist":
+    if info.network_mode == "allowlist":
         domains = ", ".join(info.network_domains or [])
-        return f"![Allowlist](https://img.shields.io/badge/Network-Allowlist-yellow) `{domains}`"
-    return "![Unknown](https://img.shields.io/badge/Network-Unknown-gray)"
+        return f"{_NETWORK_BADGES['allowlist']} `{domains}`"
+    return _NETWORK_BADGES.get(info.network_mode, _NETWORK_UNKNOWN_BADGE)
 
 
 def tier_badge(tier: str) -> str:
     """Generate tier badge markdown."""
-    if tier == "curated":
-        return "![Curated](https://img.shields.io/badge/Tier-Curated-7c3aed)"
-    elif tier == "community":
-        return "![Community](https://img.shields.io/badge/Tier-Community-blue)"
-    return f"![{tier}](https://img.shields.io/badge/Tier-{tier}-gray)"
+    badge = _TIER_BADGES.get(tier)
+    if badge is None:
+        return f"![{tier}](https://img.shields.io/badge/Tier-{tier}-gray)"
+    return badge
 
 
 def risk_badge(egress: Optional[str]) -> str:
     """Generate risk badge markdown."""
     if not egress:
         return ""
-    colors = {"low": "success", "medium": "yellow", "high": "red"}
-    color = colors.get(egress, "gray")
-    return f"![Risk: {egress}](https://img.shields.io/badge/Risk-{egress}-{color})"
+    badge = _RISK_BADGES.get(egress)
+    if badge is None:
+        return f"![Risk: {egress}](https://img.shields.io/badge/Risk-{egress}-gray)"
+    return badge
+
+
+def compute_fingerprint(heads: Dict[str, Optional[str]]) -> Optional[str]:
+    """
+    Hash everything the catalog is derived from: marketplace.json, this
+    script, and the HEAD SHA of every plugin repo. Returns None if any
+    remote could not be resolved.
+    """
+    if any(sha is None for sha in heads.values()):
+        return None
+    h = hashlib.sha256()
+    h.update(MARKETPLACE_FILE.read_bytes())
+    h.update(Path(__file__).read_bytes())
+    for url, sha in sorted(heads.items()):
+        h.update(f"\0{url}\0{sha}".encode("utf-8"))
+    return h.hexdigest()
+
+
+def catalog_digest(path: Path) -> bytes:
+    """
+    Hash a catalog file in 64 KiB chunks, skipping the fingerprint line (it
+    tracks inputs, not rendered content) and a --timestamp "Generated:"
+    line in the header, which --check never renders.
+    """
+    h = hashlib.blake2b()
+    with path.open("rb") as f:
+        first = f.readline()
+        if not first.startswith(FINGERPRINT_PREFIX.encode("utf-8")):
+            h.update(first)
+        # The header ends at the first section heading
+        for line in iter(f.readline, b""):
+            if not line.startswith(GENERATED_PREFIX):
+                h.update(line)
+            if line.startswith(b"## "):
+                break
+        for chunk in iter(partial(f.read, 1 << 16), b""):
+            h.update(chunk)
+    return h.digest()
+
+
+def stored_fingerprint() -> Optional[Tuple[str, str]]:
+    """
+    Read the (inputs fingerprint, body digest) pair recorded on the first
+    line of CATALOG.md.
+    """
+    if not CATALOG_FILE.exists():
+        return None
+    with CATALOG_FILE.open("r", encoding="utf-8") as f:
+        first = f.readline().rstrip("\n")
+    if first.startswith(FINGERPRINT_PREFIX) and first.endswith(FINGERPRINT_SUFFIX):
+        parts = first[len(FINGERPRINT_PREFIX):-len(FINGERPRINT_SUFFIX)].split()
+        if len(parts) == 2:
+            return parts[0], parts[1]
+    return None
+
+
+def catalog_is_current(fingerprint: Optional[str]) -> bool:
+    """
+    True if CATALOG.md was generated from these inputs and has not been
+    edited since: the stored body digest must still match the file.
+    """
+    stored = stored_fingerprint()
+    return (
+        fingerprint is not None and stored is not None and stored[0] == fingerprint
+        and stored[1] == catalog_digest(CATALOG_FILE).hex()
+    )
+
+
+_TABLE_HEADER = "| Capability | Value |\n|------------|-------|"
 
 
-def generate_catalog(plugins: List[PluginInfo], marketplace: dict) -> str:
-    """Generate CATALOG.md content."""
-    lines = []
+def _plugin_block(p: PluginInfo, badges: str, rows: List[str]) -> str:
+    """Render one plugin section: heading, metadata and capabilities table."""
+    version = f"**Version:** {p.version}\n" if p.version else ""
+    tags = f"**Tags:** {', '.join(p.tags)}\n" if p.tags else ""
+    table = "\n".join(rows)
+    return (
+        f"### {p.name}\n\n"
+        f"{badges}\n\n"
+        f"**Description:** {p.description}\n\n"
+        f"{version}"
+        f"**Repository:** [{p.url}]({p.url})\n"
+        f"{tags}\n"
+        f"{table}\n\n"
+    )
+
+
+def generate_catalog(
+    buf: Sink,
+    plugins: List[PluginInfo],
+    marketplace: dict,
+    fingerprint: Optional[str] = None,
+    timestamp: bool = False
+) -> None:
+    """
+    Write CATALOG.md content to buf incrementally.
+
+    Output depends only on the inputs unless timestamp is set, so --check
+    can compare bytes and unchanged catalogs stay byte-identical.
+    """
+
+    if fingerprint:
+        buf.write(f"{FINGERPRINT_PREFIX}{fingerprint}{FINGERPRINT_SUFFIX}\n")
 
     # Header
-    lines.append("# Plugin Catalog")
-    lines.append("")
-    lines.append(f"**Marketplace:** {marketplace.get('name', 'Unknown')}")
-    lines.append(f"**Version:** {marketplace.get('version', 'Unknown')}")
-    lines.append(f"**Generated:** {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}")
-    lines.append("")
-    lines.append("> This file is auto-generated by `scripts/generate-catalog.py`. Do not edit manually.")
-    lines.append("")
+    buf.write("# Plugin Catalog\n")
+    buf.write("\n")
+    buf.write(f"**Marketplace:** {marketplace.get('name', 'Unknown')}\n")
+    buf.write(f"**Version:** {marketplace.get('version', 'Unknown')}\n")
+    if timestamp:
+        buf.write(f"**Generated:** {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}\n")
+    buf.write("\n")
+    buf.write("> This file is auto-generated by `scripts/generate-catalog.py`. Do not edit manually.\n")
+    buf.write("\n")
 
     # Summary badges
-    curated = [p for p in plugins if p.tier == "curated"]
-    community = [p for p in plugins if p.tier == "community"]
-
-    lines.append("## Summary")
-    lines.append("")
-    lines.append(f"- **Total plugins:** {len(plugins)}")
-    lines.append(f"- **Curated:** {len(curated)} (no network access)")
-    lines.append(f"- **Community:** {len(community)} (network via allowlist)")
-    lines.append("")
+    curated: List[PluginInfo] = []
+    community: List[PluginInfo] = []
+    buckets = {"curated": curated, "community": community}
+    for p in plugins:
+        bucket = buckets.get(p.tier)
+        if bucket is not None:
+            bucket.append(p)
+
+    buf.write("## Summary\n")
+    buf.write("\n")
+    buf.write(f"- **Total plugins:** {len(plugins)}\n")
+    buf.write(f"- **Curated:** {len(curated)} (no network access)\n")
+    buf.write(f"- **Community:** {len(community)} (network via allowlist)\n")
+    buf.write("\n")
 
     # Curated plugins section
-    lines.append("---")
-    lines.append("")
-    lines.append("## Curated Plugins")
-    lines.append("")
-    lines.append("Security-first plugins with no network access. Recommended for teams.")
-    lines.append("")
+    buf.write("---\n")
+    buf.write("\n")
+    buf.write("## Curated Plugins\n")
+    buf.write("\n")
+    buf.write("Security-first plugins with no network access. Recommended for teams.\n")
+    buf.write("\n")
 
     if curated:
         for p in curated:
-            lines.append(f"### {p.name}")
-            lines.append("")
-            lines.append(f"{tier_badge(p.tier)} {network_badge(p)}")
-            lines.append("")
-            lines.append(f"**Description:** {p.description}")
-            lines.append("")
-            if p.version:
-                lines.append(f"**Version:** {p.version}")
-            lines.append(f"**Repository:** [{p.url}]({p.url})")
-            if p.tags:
-                lines.append(f"**Tags:** {', '.join(p.tags)}")
-            lines.append("")
-
-            # Capabilities table
-            lines.append("| Capability | Value |")
-            lines.append("|------------|-------|")
-            lines.append(f"| Network | None |")
+            rows = [_TABLE_HEADER, "| Network | None |"]
             if p.fs_write:
-                lines.append(f"| FS Writes | `{', '.join(p.fs_write[:3])}` |")
+                rows.append(f"| FS Writes | `{', '.join(p.fs_write[:3])}` |")
             if p.commands_allow:
-                lines.append(f"| Commands Allow | `{', '.join(p.commands_allow[:3])}` |")
+                rows.append(f"| Commands Allow | `{', '.join(p.commands_allow[:3])}` |")
             if p.commands_deny:
-                lines.append(f"| Commands Deny | `{', '.join(p.commands_deny[:3])}` |")
+                rows.append(f"| Commands Deny | `{', '.join(p.commands_deny[:3])}` |")
             if p.secrets_required:
-                lines.append(f"| Secrets Required | `{', '.join(p.secrets_required)}` |")
-            lines.append("")
+                rows.append(f"| Secrets Required | `{', '.join(p.secrets_required)}` |")
+            buf.write(_plugin_block(p, f"{tier_badge(p.tier)} {network_badge(p)}", rows))
     else:
-        lines.append("*No curated plugins yet.*")
-        lines.append("")
+        buf.write("*No curated plugins yet.*\n")
+        buf.write("\n")
 
     # Community plugins section
-    lines.append("---")
-    lines.append("")
-    lines.append("## Community Plugins")
-    lines.append("")
-    lines.append("Community-contributed plugins. May use network via explicit allowlist.")
-    lines.append("")
+    buf.write("---\n")
+    buf.write("\n")
+    buf.write("## Community Plugins\n")
+    buf.write("\n")
+    buf.write("Community-contributed plugins. May use network via explicit allowlist.\n")
+    buf.write("\n")
 
     if community:
         for p in community:
-            lines.append(f"### {p.name}")
-            lines.append("")
-            lines.append(f"{tier_badge(p.tier)} {network_badge(p)} {risk_badge(p.risk_egress)}")
-            lines.append("")
-            lines.append(f"**Description:** {p.description}")
-            lines.append("")
-            if p.version:
-                lines.append(f"**Version:** {p.version}")
-            lines.append(f"**Repository:** [{p.url}]({p.url})")
-            if p.tags:
-                lines.append(f"**Tags:** {', '.join(p.tags)}")
-            lines.append("")
-
-            # Capabilities table
-            lines.append("| Capability | Value |")
-            lines.append("|------------|-------|")
+            rows = [_TABLE_HEADER]
             if p.network_mode == "allowlist" and p.network_domains:
-                lines.append(f"| Network Domains | `{', '.join(p.network_domains)}` |")
+                rows.append(f"| Network Domains | `{', '.join(p.network_domains)}` |")
             if p.fs_write:
-                lines.append(f"| FS Writes | `{', '.join(p.fs_write[:3])}` |")
+                rows.append(f"| FS Writes | `{', '.join(p.fs_write[:3])}` |")
             if p.secrets_required:
-                lines.append(f"| Secrets Required | `{', '.join(p.secrets_required)}` |")
+                rows.append(f"| Secrets Required | `{', '.join(p.secrets_required)}` |")
             if p.risk_egress:
-                lines.append(f"| Risk Level | {p.risk_egress} |")
+                rows.append(f"| Risk Level | {p.risk_egress} |")
             if p.risk_notes:
-                lines.append(f"| Risk Notes | {p.risk_notes} |")
-            lines.append("")
+                rows.append(f"| Risk Notes | {p.risk_notes} |")
+            badges = f"{tier_badge(p.tier)} {network_badge(p)} {risk_badge(p.risk_egress)}"
+            buf.write(_plugin_block(p, badges, rows))
     else:
-        lines.append("*No community plugins yet. [Submit yours!](CONTRIBUTING.md)*")
-        lines.append("")
+        buf.write("*No community plugins yet. [Submit yours!](CONTRIBUTING.md)*\n")
+        buf.write("\n")
 
     # Permission legend
-    lines.append("---")
-    lines.append("")
-    lines.append("## Permission Badges Legend")
-    lines.append("")
-    lines.append("| Badge | Meaning |")
-    lines.append("|-------|---------|")
-    lines.append("| ![Curated](https://img.shields.io/badge/Tier-Curated-7c3aed) | Security-first, no network |")
-    lines.append("| ![Community](https://img.shields.io/badge/Tier-Community-blue) | Network via allowlist |")
-    lines.append("| ![None](https://img.shields.io/badge/Network-None-success) | No network access |")
-    lines.append("| ![Allowlist](https://img.shields.io/badge/Network-Allowlist-yellow) | Specific domains only |")
-    lines.append("| ![Risk: low](https://img.shields.io/badge/Risk-low-success) | Low data egress risk |")
-    lines.append("| ![Risk: medium](https://img.shields.io/badge/Risk-medium-yellow) | Medium data egress risk |")
-    lines.append("| ![Risk: high](https://img.shields.io/badge/Risk-high-red) | High data egress risk |")
-    lines.append("")
-
-    return "\n".join(lines)
+    buf.write("---\n")
+    buf.write("\n")
+    buf.write("## Permission Badges Legend\n")
+    buf.write("\n")
+    buf.write("| Badge | Meaning |\n")
+    buf.write("|-------|---------|\n")
+    buf.write("| ![Curated](https://img.shields.io/badge/Tier-Curated-7c3aed) | Security-first, no network |\n")
+    buf.write("| ![Community](https://img.shields.io/badge/Tier-Community-blue) | Network via allowlist |\n")
+    buf.write("| ![None](https://img.shields.io/badge/Network-None-success) | No network access |\n")
+    buf.write("| ![Allowlist](https://img.shields.io/badge/Network-Allowlist-yellow) | Specific domains only |\n")
+    buf.write("| ![Risk: low](https://img.shields.io/badge/Risk-low-success) | Low data egress risk |\n")
+    buf.write("| ![Risk: medium](https://img.shields.io/badge/Risk-medium-yellow) | Medium data egress risk |\n")
+    buf.write("| ![Risk: high](https://img.shields.io/badge/Risk-high-red) | High data egress risk |\n")
+
+
+def write_catalog(
+    plugins: List[PluginInfo],
+    marketplace: dict,
+    fingerprint: Optional[str] = None,
+    timestamp: bool = False
+) -> None:
+    """
+    Stream the catalog to disk, replacing CATALOG.md only once complete.
+    The fingerprint line also records a digest of the rendered body, so
+    --check can tell a hand-edited catalog from an up-to-date one.
+    """
+    if fingerprint:
+        body = HashingSink()
+        generate_catalog(body, plugins, marketplace)
+        fingerprint = f"{fingerprint} {body.digest().hex()}"
+
+    tmp = CATALOG_FILE.with_name(CATALOG_FILE.name + ".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        sink = Utf8FileSink(fd)
+        generate_catalog(sink, plugins, marketplace, fingerprint, timestamp)
+        sink.flush()
+    finally:
+        os.close(fd)
+    os.replace(tmp, CATALOG_FILE)
+
+
+def _fetch(plugin: dict, heads: Dict[str, Optional[str]]) -> FetchResult:
+    """Fetch a single plugin's manifest, or the clone to read it from."""
+    name = plugin.get("name", "unknown")
+    url = plugin.get("source", {}).get("url", "")
+    result = FetchResult(plugin=plugin, log=[f"Processing: {name}"])
+
+    if not url:
+        return result
+
+    sha = heads.get(url)
+    if sha:
+        cached = load_cached_manifest(sha)
+        if cached is not None:
+            result.data = cached or None
+            return result
+
+    try:
+        if github_repo(url):
+            # GitHub serves raw files directly; no need to clone the repo
+            result.data = fetch_manifest(url, sha or "HEAD")
+            if sha:
+                store_cached_manifest(sha, result.data)
+        else:
+            result.repo_path = cached_repo(url, sha)
+            if not result.repo_path:
+                result.log.append(f"  Warning: Could not clone {url}")
+    except Exception as e:
+        result.log.append(f"  Warning: Could not read manifest: {e}")
+
+    return result
 
 
 def main():
-    check_mode = "--check" in sys.argv
+    parser = argparse.ArgumentParser(
+        description="Generate CATALOG.md from marketplace.json and plugin manifests"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Check if CATALOG.md is up to date instead of writing it (CI mode)"
+    )
+    parser.add_argument(
+        "--timestamp",
+        action="store_true",
+        help="Add a 'Generated:' timestamp line (ignored with --check)"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Number of repos to fetch concurrently (default: {DEFAULT_JOBS})"
+    )
+    args = parser.parse_args()
+    check_mode = args.check
+    jobs = max(1, args.jobs)
 
     marketplace = load_marketplace()
     plugins_data = marketplace.get("plugins", [])
@@ -287,64 +710,66 @@ def main():
         if check_mode:
             return 0
         # Still generate empty catalog
-        content = generate_catalog([], marketplace)
-        CATALOG_FILE.write_text(content, encoding="utf-8")
+        write_catalog([], marketplace, timestamp=args.timestamp)
         print(f"Generated {CATALOG_FILE}")
         return 0
 
-    # Create temp directory
-    if TMP_DIR.exists():
-        shutil.rmtree(TMP_DIR)
-    TMP_DIR.mkdir(parents=True)
-
-    plugins: List[PluginInfo] = []
-
-    try:
-        for plugin in plugins_data:
-            name = plugin.get("name", "unknown")
-            url = plugin.get("source", {}).get("url", "")
-
-            print(f"Processing: {name}")
-
-            repo_path = None
-            if url:
-                dest = TMP_DIR / name.replace("/", "_")
-                if clone_repo(url, dest):
-                    repo_path = dest
-                else:
-                    print(f"  Warning: Could not clone {url}")
+    # Cheap up-front check: one ls-remote per plugin instead of a full fetch
+    urls = [p.get("source", {}).get("url", "") for p in plugins_data]
+    heads = remote_heads([u for u in urls if u], jobs)
+    fingerprint = compute_fingerprint(heads)
+    if check_mode and catalog_is_current(fingerprint):
+        print("✅ CATALOG.md is up to date (inputs unchanged)")
+        return 0
 
-            info = extract_plugin_info(plugin, repo_path)
-            plugins.append(info)
+    gc_cache()
 
-        content = generate_catalog(plugins, marketplace)
+    plugins: List[PluginInfo] = []
 
-        if check_mode:
-            # Check if existing catalog matches
-            if CATALOG_FILE.exists():
-                existing = CATALOG_FILE.read_text(encoding="utf-8")
-                # Compare ignoring the "Generated:" timestamp line
-                def strip_timestamp(s):
-                    lines = s.split("\n")
-                    return "\n".join(l for l in lines if not l.startswith("**Generated:**"))
-
-                if strip_timestamp(existing) != strip_timestamp(content):
-                    print("❌ CATALOG.md is out of date. Run: python scripts/generate-catalog.py")
-                    return 1
-                else:
-                    print("✅ CATALOG.md is up to date")
-                    return 0
-            else:
-                print("❌ CATALOG.md does not exist. Run: python scripts/generate-catalog.py")
+    # Fetches are network-bound and independent, so run them concurrently
+    workers = min(jobs, len(plugins_data))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        results = list(ex.map(partial(_fetch, heads=heads), plugins_data))
+
+    # Read manifests out of every cloned repo in one batch
+    cloned = [r for r in results if r.repo_path]
+    for r, data in zip(cloned, read_manifests([r.repo_path for r in cloned])):
+        r.data = data
+        store_cached_manifest(r.repo_path.name, data)
+
+    # Log and parse in marketplace order so output stays deterministic
+    for r in results:
+        manifest = None
+        if r.data:
+            try:
+                manifest = json_loads(r.data)
+            except ValueError as e:
+                r.log.append(f"  Warning: Could not read manifest: {e}")
+        for line in r.log:
+            print(line)
+        info = extract_plugin_info(r.plugin, manifest)
+        plugins.append(info)
+
+    if check_mode:
+        # Check if existing catalog matches
+        if CATALOG_FILE.exists():
+            # Render without the fingerprint line so both digests cover the same bytes
+            sink = HashingSink()
+            generate_catalog(sink, plugins, marketplace)
+
+            if catalog_digest(CATALOG_FILE) != sink.digest():
+                print("❌ CATALOG.md is out of date. Run: python scripts/generate-catalog.py")
                 return 1
+            else:
+                print("✅ CATALOG.md is up to date")
+                return 0
         else:
-            CATALOG_FILE.write_text(content, encoding="utf-8")
-            print(f"\n✅ Generated {CATALOG_FILE}")
-            return 0
-
-    finally:
-        if TMP_DIR.exists():
-            shutil.rmtree(TMP_DIR)
+            print("❌ CATALOG.md does not exist. Run: python scripts/generate-catalog.py")
+            return 1
+    else:
+        write_catalog(plugins, marketplace, fingerprint, args.timestamp)
+        print(f"\n✅ Generated {CATALOG_FILE}")
+        return 0
 
 
 if __name__ == "__main__":
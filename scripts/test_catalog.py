@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Unit tests for generate-catalog.py
+
+Run with: python -m pytest scripts/test_catalog.py -v
+Or:       python scripts/test_catalog.py
+"""
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+import urllib.error
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Optional
+from unittest import mock
+
+# Import from generate-catalog
+sys.path.insert(0, str(Path(__file__).parent))
+from importlib import import_module
+
+catalog = import_module("generate-catalog")
+
+GIT_IDENTITY = ["-c", "user.name=t", "-c", "user.email=t@example.com"]
+
+PLUGIN_MANIFESTS = {
+    "demo": {
+        "name": "demo",
+        "version": "1.0.0",
+        "capabilities": {
+            "network": {"mode": "none"},
+            "filesystem": {"write": ["./out"]},
+            "commands": {"allow": ["git status", "git diff"], "deny": ["rm"]},
+        },
+    },
+    "netty": {
+        "name": "netty",
+        "version": "0.2.0",
+        "capabilities": {
+            "network": {"mode": "allowlist", "domains": ["api.example.com", "cdn.example.com"]},
+            "filesystem": {"write": ["./a", "./b", "./c", "./d"]},
+            "secrets": {"required": ["API_TOKEN"]},
+        },
+        "risk": {"dataEgress": "medium", "notes": "Sends prompts to api.example.com"},
+    },
+    "bare": None,
+}
+
+# (name, tier, description, tags)
+MARKETPLACE_PLUGINS = [
+    ("demo", "curated", "Demo plugin", ["demo"]),
+    ("netty", "community", "Network plugin", ["net", "api"]),
+    ("bare", "community", "No manifest", []),
+]
+
+# What the original list-of-lines generator rendered for the plugins above,
+# minus its always-present "Generated:" line. The bare plugin's badge line
+# ends in a space (its risk badge is empty).
+EXPECTED_CATALOG = """\
+# Plugin Catalog
+
+**Marketplace:** test-marketplace
+**Version:** 1.0.0
+
+> This file is auto-generated by `scripts/generate-catalog.py`. Do not edit manually.
+
+## Summary
+
+- **Total plugins:** 3
+- **Curated:** 1 (no network access)
+- **Community:** 2 (network via allowlist)
+
+---
+
+## Curated Plugins
+
+Security-first plugins with no network access. Recommended for teams.
+
+### demo
+
+![Curated](https://img.shields.io/badge/Tier-Curated-7c3aed) ![None](https://img.shields.io/badge/Network-None-success)
+
+**Description:** Demo plugin
+
+**Version:** 1.0.0
+**Repository:** [file:///demo](file:///demo)
+**Tags:** demo
+
+| Capability | Value |
+|------------|-------|
+| Network | None |
+| FS Writes | `./out` |
+| Commands Allow | `git status, git diff` |
+| Commands Deny | `rm` |
+
+---
+
+## Community Plugins
+
+Community-contributed plugins. May use network via explicit allowlist.
+
+### netty
+
+![Community](https://img.shields.io/badge/Tier-Community-blue) ![Allowlist](https://img.shields.io/badge/Network-Allowlist-yellow) `api.example.com, cdn.example.com` ![Risk: medium](https://img.shields.io/badge/Risk-medium-yellow)
+
+**Description:** Network plugin
+
+**Version:** 0.2.0
+**Repository:** [file:///netty](file:///netty)
+**Tags:** net, api
+
+| Capability | Value |
+|------------|-------|
+| Network Domains | `api.example.com, cdn.example.com` |
+| FS Writes | `./a, ./b, ./c` |
+| Secrets Required | `API_TOKEN` |
+| Risk Level | medium |
+| Risk Notes | Sends prompts to api.example.com |
+
+### bare
+
+![Community](https://img.shields.io/badge/Tier-Community-blue) ![None](https://img.shields.io/badge/Network-None-success) 
+
+**Description:** No manifest
+
+**Repository:** [file:///bare](file:///bare)
+
+| Capability | Value |
+|------------|-------|
+
+---
+
+## Permission Badges Legend
+
+| Badge | Meaning |
+|-------|---------|
+| ![Curated](https://img.shields.io/badge/Tier-Curated-7c3aed) | Security-first, no network |
+| ![Community](https://img.shields.io/badge/Tier-Community-blue) | Network via allowlist |
+| ![None](https://img.shields.io/badge/Network-None-success) | No network access |
+| ![Allowlist](https://img.shields.io/badge/Network-Allowlist-yellow) | Specific domains only |
+| ![Risk: low](https://img.shields.io/badge/Risk-low-success) | Low data egress risk |
+| ![Risk: medium](https://img.shields.io/badge/Risk-medium-yellow) | Medium data egress risk |
+| ![Risk: high](https://img.shields.io/badge/Risk-high-red) | High data egress risk |
+"""
+
+
+def make_plugin_repo(path: Path, manifest: Optional[dict]) -> str:
+    """Create a one-commit git repo holding manifest; returns its file:// URL."""
+    path.mkdir(parents=True)
+    if manifest is not None:
+        (path / ".claude-plugin").mkdir()
+        (path / ".claude-plugin" / "plugin.json").write_text(json.dumps(manifest), encoding="utf-8")
+    (path / "README.md").write_text("# Plugin\n", encoding="utf-8")
+    git = ["git", "-C", str(path), *GIT_IDENTITY]
+    for args in (["init", "-q"], ["add", "."], ["commit", "-q", "-m", "init"],
+                 ["config", "uploadpack.allowFilter", "true"]):
+        subprocess.run(git + args, check=True)
+    return path.as_uri()
+
+
+class CatalogSandbox(unittest.TestCase):
+    """Marketplace, plugin repo, catalog and cache all under a temp dir."""
+
+    def setUp(self):
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        self.urls = {
+            name: make_plugin_repo(self.tmp_dir / name, manifest)
+            for name, manifest in PLUGIN_MANIFESTS.items()
+        }
+        self.marketplace = {
+            "name": "test-marketplace",
+            "version": "1.0.0",
+            "plugins": [
+                {
+                    "name": name,
+                    "tier": tier,
+                    "description": description,
+                    "source": {"source": "url", "url": self.urls[name]},
+                    "tags": tags,
+                }
+                for name, tier, description, tags in MARKETPLACE_PLUGINS
+            ],
+        }
+        marketplace_file = self.tmp_dir / "marketplace.json"
+        marketplace_file.write_text(json.dumps(self.marketplace), encoding="utf-8")
+        self.catalog_file = self.tmp_dir / "CATALOG.md"
+        cache_dir = self.tmp_dir / "cache"
+        patcher = mock.patch.multiple(
+            catalog,
+            MARKETPLACE_FILE=marketplace_file,
+            CATALOG_FILE=self.catalog_file,
+            CACHE_DIR=cache_dir,
+            REPO_CACHE_DIR=cache_dir / "repos",
+            MANIFEST_CACHE_DIR=cache_dir / "manifests",
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def main(self, *args: str):
+        """Run main() with args; returns (exit code, printed output)."""
+        out = io.StringIO()
+        with mock.patch.object(sys, "argv", ["generate-catalog.py", *args]), redirect_stdout(out):
+            code = catalog.main()
+        return code, out.getvalue()
+
+    def head(self, name: str) -> str:
+        out = subprocess.run(["git", "-C", str(self.tmp_dir / name), "rev-parse", "HEAD"],
+                             check=True, capture_output=True, text=True).stdout
+        return out.strip()
+
+    def commit_upstream(self, name: str, rel: str, content: str) -> None:
+        repo = self.tmp_dir / name
+        (repo / rel).write_text(content, encoding="utf-8")
+        subprocess.run(["git", "-C", str(repo), *GIT_IDENTITY, "commit", "-q", "-am", "update"], check=True)
+
+    def expected(self) -> str:
+        text = EXPECTED_CATALOG
+        for name, url in self.urls.items():
+            text = text.replace(f"file:///{name}", url)
+        return text
+
+    def edit_catalog(self, old: str, new: str) -> None:
+        text = self.catalog_file.read_text(encoding="utf-8")
+        self.assertIn(old, text)
+        self.catalog_file.write_text(text.replace(old, new), encoding="utf-8")
+
+
+class TestCheck(CatalogSandbox):
+    """Test --check against a generated catalog."""
+
+    def test_check_passes_on_fresh_catalog(self):
+        self.assertEqual(self.main()[0], 0)
+        code, out = self.main("--check")
+        self.assertEqual(code, 0)
+        self.assertIn("up to date (inputs unchanged)", out)
+
+    def test_check_fails_after_hand_edit(self):
+        self.main()
+        self.edit_catalog("**Description:** Demo plugin", "**Description:** Edited")
+        code, out = self.main("--check")
+        self.assertEqual(code, 1)
+        self.assertIn("out of date", out)
+
+    def test_check_ignores_generated_timestamp(self):
+        self.main("--timestamp")
+        self.assertIn("**Generated:** ", self.catalog_file.read_text(encoding="utf-8"))
+        self.assertIn("(inputs unchanged)", self.main("--check")[1])
+
+        # A README-only upstream commit misses the fingerprint but not the render
+        self.commit_upstream("demo", "README.md", "# Plugin v2\n")
+        code, out = self.main("--check")
+        self.assertEqual(code, 0)
+        self.assertNotIn("(inputs unchanged)", out)
+
+    def test_check_fails_after_upstream_manifest_change(self):
+        self.main()
+        manifest = dict(PLUGIN_MANIFESTS["demo"], version="1.1.0")
+        self.commit_upstream("demo", ".claude-plugin/plugin.json", json.dumps(manifest))
+        code, out = self.main("--check")
+        self.assertEqual(code, 1)
+        self.assertIn("out of date", out)
+
+    def test_check_fails_without_catalog(self):
+        self.assertEqual(self.main("--check")[0], 1)
+
+
+class TestRender(CatalogSandbox):
+    """Test the rendered catalog against the original generator's output."""
+
+    def test_render_matches_original_output(self):
+        self.assertEqual(self.main()[0], 0)
+        first, _, body = self.catalog_file.read_bytes().partition(b"\n")
+        self.assertTrue(first.startswith(catalog.FINGERPRINT_PREFIX.encode("utf-8")))
+        self.assertEqual(body, self.expected().encode("utf-8"))
+
+        # The second run reads every manifest from the cache
+        before = self.catalog_file.read_bytes()
+        self.main()
+        self.assertEqual(self.catalog_file.read_bytes(), before)
+
+    def test_timestamp_adds_only_generated_line(self):
+        self.main("--timestamp")
+        lines = self.catalog_file.read_text(encoding="utf-8").split("\n")[1:]
+        self.assertTrue(lines[4].startswith("**Generated:** "))
+        del lines[4]
+        self.assertEqual("\n".join(lines), self.expected())
+
+
+class TestManifestCache(CatalogSandbox):
+    """Test the per-commit manifest cache and its garbage collection."""
+
+    def test_missing_manifest_cached_as_empty(self):
+        self.main()
+        self.assertEqual(catalog.load_cached_manifest(self.head("bare")), b"")
+        cached = catalog.load_cached_manifest(self.head("demo"))
+        self.assertEqual(json.loads(cached), PLUGIN_MANIFESTS["demo"])
+
+    def test_github_404_cached_as_empty(self):
+        url = "https://github.com/owner/plugin"
+        plugin = {"name": "gh", "source": {"source": "url", "url": url}}
+        not_found = urllib.error.HTTPError(url, 404, "Not Found", None, None)
+        with mock.patch.object(catalog.urllib.request, "urlopen", side_effect=not_found) as urlopen:
+            result = catalog._fetch(plugin, {url: "a" * 40})
+            self.assertIsNone(result.data)
+            self.assertEqual(urlopen.call_count, len(catalog.MANIFEST_PATHS))
+            self.assertEqual(catalog.load_cached_manifest("a" * 40), b"")
+
+            # A known commit is answered from the cache without a request
+            catalog._fetch(plugin, {url: "a" * 40})
+            self.assertEqual(urlopen.call_count, len(catalog.MANIFEST_PATHS))
+
+    def test_gc_drops_only_old_entries(self):
+        self.main()
+        old = time.time() - catalog.CACHE_MAX_AGE_SECONDS - 60
+        stale_manifest = catalog.MANIFEST_CACHE_DIR / self.head("demo")
+        stale_repo = catalog.REPO_CACHE_DIR / self.head("demo")
+        for entry in (stale_manifest, stale_repo):
+            os.utime(entry, (old, old))
+
+        catalog.gc_cache()
+        self.assertFalse(stale_manifest.exists())
+        self.assertFalse(stale_repo.exists())
+        self.assertIsNotNone(catalog.load_cached_manifest(self.head("netty")))
+        self.assertTrue((catalog.REPO_CACHE_DIR / self.head("netty")).is_dir())
+
+
+def run_tests():
+    """Run all tests and print summary."""
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 50)
+    total = result.testsRun
+    if result.wasSuccessful():
+        print(f"✅ All {total} tests passed!")
+        return 0
+    else:
+        print(f"❌ {len(result.failures)} failures, {len(result.errors)} errors out of {total} tests")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_tests())
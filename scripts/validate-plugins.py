@@ -13,15 +13,28 @@ Exit codes:
 - 0: All plugins pass validation
 - 1: One or more plugins failed validation
 """
+import io
 import json
+import multiprocessing
 import os
 import re
 import shutil
+import stat
 import subprocess
 import sys
+import threading
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Set, Any
+from typing import Dict, Iterator, List, NamedTuple, Tuple, Optional, Set, Any
+
+try:
+    # Optional C-accelerated parser; stdlib json is the fallback
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 ROOT = Path(__file__).resolve().parents[1]
 MARKETPLACE_FILE = ROOT / ".claude-plugin" / "marketplace.json"
@@ -36,41 +49,55 @@ MAX_FILE_SIZE_BYTES = 2 * 1024 * 1024      # 2MB per file hard fail
 MAX_REPO_SIZE_BYTES = 20 * 1024 * 1024     # 20MB total repo hard fail (excluding .git)
 MAX_FILES_COUNT = 2500                     # avoid huge repos
 MAX_READ_BYTES_FOR_BINARY_CHECK = 4096
+MAX_PARALLEL_PLUGINS = 8                   # concurrent clone + scan workers
+MIN_FILES_FOR_SCAN_POOL = 32               # scan in worker processes from this many files
+MAX_MESSAGES_PER_CATEGORY = 100            # errors/warnings listed per plugin; the rest are counted
+ERROR_OUTPUT_TAIL_BYTES = 4096             # stderr kept from a failed quiet command
+
+# Never let git block on a credential prompt: a private or mistyped URL
+# would otherwise hang its worker (and the whole run) indefinitely
+GIT_ENV = {**os.environ, "GIT_TERMINAL_PROMPT": "0", "GIT_ASKPASS": "/bin/true"}
 
-ALLOWED_TIERS = {"curated", "community"}
-ALLOWED_SOURCE_TYPES = {"git"}
+ALLOWED_TIERS = frozenset({"curated", "community"})
+ALLOWED_SOURCE_TYPES = frozenset({"git"})
 
-REQUIRED_FILES = ["README.md", "LICENSE"]
+REQUIRED_FILES = ("README.md", "LICENSE")
 POSSIBLE_PLUGIN_MANIFESTS = ["plugin.json", ".claude-plugin/plugin.json"]
 POSSIBLE_CONTENT_DIRS = ["commands", "agents", "hooks", "skills"]
 
 # Disallowed binary-ish extensions often abused / bloating marketplace
-DISALLOWED_EXTENSIONS = {
+DISALLOWED_EXTENSIONS = frozenset({
     ".exe", ".dll", ".so", ".dylib",
     ".bin", ".dat",
     ".zip", ".rar", ".7z", ".tar", ".gz", ".bz2", ".xz",
     ".png", ".jpg", ".jpeg", ".webp", ".gif", ".mp4", ".mov", ".avi", ".mkv",
     ".pdf",
     ".wasm",
-}
+})
 
 # Allowed large-ish text formats (still size-limited above)
-TEXT_EXTENSIONS = {
+TEXT_EXTENSIONS = frozenset({
     ".md", ".txt", ".json", ".yml", ".yaml", ".toml",
     ".py", ".js", ".ts", ".sh", ".zsh", ".bash",
     ".rb", ".go", ".rs", ".java", ".kt", ".swift",
-}
+})
 
-# Skip noise dirs during scan
-SKIP_DIRS = {
+# Skip noise dirs during scan (whole subtrees are pruned, never listed)
+SKIP_DIRS = frozenset({
     ".git", ".idea", ".vscode", "__pycache__", ".gradle", "build",
     "dist", "node_modules", ".tmp", ".cache"
-}
+})
 
 SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+(-[0-9A-Za-z\.-]+)?(\+[0-9A-Za-z\.-]+)?$")
 GITHUB_REPO_RE = re.compile(r"^https://github\.com/[^/]+/[^/]+(\.git)?$")
 PLUGIN_NAME_RE = re.compile(r"^[a-z][a-z0-9-]*$")
-DOMAIN_RE = re.compile(r"^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?)*$")
+# Well-formed domain; an IPv4 address also matches, via the ipv4 group, so
+# one match both validates a domain and tells that it must be rejected
+DOMAIN_RE = re.compile(
+    r"^(?:(?P<ipv4>[0-9]+\.[0-9]+\.[0-9]+\.[0-9]+)$"
+    r"|[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?)*$)"
+)
+SPARSE_SPECIAL_RE = re.compile(r"([\\*?\[\]])")
 
 # =========================
 # SECURITY PATTERNS
@@ -79,85 +106,176 @@ DOMAIN_RE = re.compile(r"^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?(\.[a-zA-Z0-9]([
 # Secrets detection patterns (hardcoded credentials)
 SECRET_PATTERNS = [
     # AWS
-    (r"AKIA[0-9A-Z]{16}", "AWS Access Key ID"),
-    (r"(?i)aws[_-]?secret[_-]?access[_-]?key\s*[=:]\s*['\"][^'\"]+['\"]", "AWS Secret Key assignment"),
+    (r"AKIA[0-9A-Z]{16}", "AWS Access Key ID", "akia"),
+    (r"(?i)aws[_-]?secret[_-]?access[_-]?key\s*[=:]\s*['\"][^'\"]+['\"]", "AWS Secret Key assignment", "secret"),
     # Generic API keys
-    (r"(?i)api[_-]?key\s*[=:]\s*['\"][a-zA-Z0-9_\-]{20,}['\"]", "API key assignment"),
-    (r"(?i)api[_-]?secret\s*[=:]\s*['\"][^'\"]+['\"]", "API secret assignment"),
+    (r"(?i)api[_-]?key\s*[=:]\s*['\"][a-zA-Z0-9_\-]{20,}['\"]", "API key assignment", "api"),
+    (r"(?i)api[_-]?secret\s*[=:]\s*['\"][^'\"]+['\"]", "API secret assignment", "secret"),
     # Tokens
-    (r"(?i)bearer\s+[a-zA-Z0-9_\-\.]+", "Bearer token"),
-    (r"(?i)token\s*[=:]\s*['\"][a-zA-Z0-9_\-]{20,}['\"]", "Token assignment"),
-    (r"ghp_[a-zA-Z0-9]{36}", "GitHub Personal Access Token"),
-    (r"gho_[a-zA-Z0-9]{36}", "GitHub OAuth Token"),
-    (r"github_pat_[a-zA-Z0-9]{22}_[a-zA-Z0-9]{59}", "GitHub Fine-grained PAT"),
+    (r"(?i)bearer\s+[a-zA-Z0-9_\-\.]+", "Bearer token", "bearer"),
+    (r"(?i)token\s*[=:]\s*['\"][a-zA-Z0-9_\-]{20,}['\"]", "Token assignment", "token"),
+    (r"ghp_[a-zA-Z0-9]{36}", "GitHub Personal Access Token", "ghp_"),
+    (r"gho_[a-zA-Z0-9]{36}", "GitHub OAuth Token", "gho_"),
+    (r"github_pat_[a-zA-Z0-9]{22}_[a-zA-Z0-9]{59}", "GitHub Fine-grained PAT", "github_pat_"),
     # Private keys
-    (r"-----BEGIN (?:RSA |DSA |EC |OPENSSH )?PRIVATE KEY-----", "Private key"),
+    (r"-----BEGIN (?:RSA |DSA |EC |OPENSSH )?PRIVATE KEY-----", "Private key", "private key-----"),
     # Passwords
-    (r"(?i)password\s*[=:]\s*['\"][^'\"]{8,}['\"]", "Password assignment"),
-    (r"(?i)passwd\s*[=:]\s*['\"][^'\"]+['\"]", "Password assignment"),
+    (r"(?i)password\s*[=:]\s*['\"][^'\"]{8,}['\"]", "Password assignment", "password"),
+    (r"(?i)passwd\s*[=:]\s*['\"][^'\"]+['\"]", "Password assignment", "passwd"),
     # Slack/Discord
-    (r"xox[baprs]-[0-9a-zA-Z-]+", "Slack token"),
-    (r"(?i)discord[_-]?(?:token|webhook)\s*[=:]\s*['\"][^'\"]+['\"]", "Discord token/webhook"),
+    (r"xox[baprs]-[0-9a-zA-Z-]+", "Slack token", "xox"),
+    (r"(?i)discord[_-]?(?:token|webhook)\s*[=:]\s*['\"][^'\"]+['\"]", "Discord token/webhook", "discord"),
     # Generic secrets
-    (r"(?i)secret\s*[=:]\s*['\"][a-zA-Z0-9_\-]{16,}['\"]", "Secret assignment"),
+    (r"(?i)secret\s*[=:]\s*['\"][a-zA-Z0-9_\-]{16,}['\"]", "Secret assignment", "secret"),
 ]
 
+# Every secret pattern contains one of these (lowercased); text without any
+# of them cannot match, so the regex scan is skipped entirely
+SECRET_KEYWORDS = (
+    "akia", "aws", "api", "bearer", "token", "ghp_", "gho_", "github_pat_",
+    "private key", "password", "passwd", "xox", "discord", "secret",
+)
+
 # Network/telemetry patterns - code libraries
 NETWORK_CODE_PATTERNS = [
     # Python
-    (r"^\s*import\s+requests\b", "requests import"),
-    (r"^\s*from\s+requests\s+import", "requests import"),
-    (r"^\s*import\s+urllib\.request", "urllib.request import"),
-    (r"^\s*from\s+urllib\.request\s+import", "urllib.request import"),
-    (r"^\s*import\s+http\.client", "http.client import"),
-    (r"^\s*import\s+aiohttp", "aiohttp import"),
-    (r"^\s*import\s+httpx", "httpx import"),
-    (r"requests\.(get|post|put|delete|patch)\s*\(", "requests HTTP call"),
-    (r"urllib\.request\.(urlopen|Request)", "urllib HTTP call"),
-    (r"^\s*import\s+socket\b", "socket import"),
-    (r"^\s*from\s+socket\s+import", "socket import"),
+    (r"^\s*import\s+requests\b", "requests import", "requests"),
+    (r"^\s*from\s+requests\s+import", "requests import", "requests"),
+    (r"^\s*import\s+urllib\.request", "urllib.request import", "urllib.request"),
+    (r"^\s*from\s+urllib\.request\s+import", "urllib.request import", "urllib.request"),
+    (r"^\s*import\s+http\.client", "http.client import", "http.client"),
+    (r"^\s*import\s+aiohttp", "aiohttp import", "aiohttp"),
+    (r"^\s*import\s+httpx", "httpx import", "httpx"),
+    (r"requests\.(get|post|put|delete|patch)\s*\(", "requests HTTP call", "requests."),
+    (r"urllib\.request\.(urlopen|Request)", "urllib HTTP call", "urllib.request."),
+    (r"^\s*import\s+socket\b", "socket import", "socket"),
+    (r"^\s*from\s+socket\s+import", "socket import", "socket"),
     # JavaScript/TypeScript
-    (r"\bfetch\s*\(", "fetch() call"),
-    (r"\baxios\s*[\.\(]", "axios call"),
-    (r"new\s+XMLHttpRequest", "XMLHttpRequest"),
-    (r"\.ajax\s*\(", "jQuery ajax call"),
-    (r"require\s*\(\s*['\"]https?['\"]", "Node http/https require"),
-    (r"from\s+['\"]node:https?['\"]", "Node http/https import"),
+    (r"\bfetch\s*\(", "fetch() call", "fetch"),
+    (r"\baxios\s*[\.\(]", "axios call", "axios"),
+    (r"new\s+XMLHttpRequest", "XMLHttpRequest", "xmlhttprequest"),
+    (r"\.ajax\s*\(", "jQuery ajax call", ".ajax"),
+    (r"require\s*\(\s*['\"]https?['\"]", "Node http/https require", "require"),
+    (r"from\s+['\"]node:https?['\"]", "Node http/https import", "node:http"),
     # WebSocket
-    (r"\bWebSocket\s*\(", "WebSocket connection"),
-    (r"^\s*import\s+websocket", "websocket import"),
+    (r"\bWebSocket\s*\(", "WebSocket connection", "websocket"),
+    (r"^\s*import\s+websocket", "websocket import", "websocket"),
 ]
 
 # Shell network commands
 SHELL_NETWORK_PATTERNS = [
-    (r"\bcurl\s+", "curl command"),
-    (r"\bwget\s+", "wget command"),
-    (r"\bnc\s+", "netcat (nc) command"),
-    (r"\bncat\s+", "ncat command"),
-    (r"\bsocat\s+", "socat command"),
-    (r"\bssh\s+", "ssh command"),
-    (r"\bscp\s+", "scp command"),
-    (r"\brsync\s+.*:", "rsync remote command"),
-    (r"Invoke-WebRequest", "PowerShell Invoke-WebRequest"),
-    (r"Invoke-RestMethod", "PowerShell Invoke-RestMethod"),
-    (r"\btelnet\s+", "telnet command"),
+    (r"\bcurl\s+", "curl command", "curl"),
+    (r"\bwget\s+", "wget command", "wget"),
+    (r"\bnc\s+", "netcat (nc) command", "nc"),
+    (r"\bncat\s+", "ncat command", "ncat"),
+    (r"\bsocat\s+", "socat command", "socat"),
+    (r"\bssh\s+", "ssh command", "ssh"),
+    (r"\bscp\s+", "scp command", "scp"),
+    # Tempered so each rsync only scans up to the next one (linear on long lines)
+    (r"\brsync\s+(?:(?!\brsync\s)[^\n])*:", "rsync remote command", "rsync"),
+    (r"Invoke-WebRequest", "PowerShell Invoke-WebRequest", "invoke-webrequest"),
+    (r"Invoke-RestMethod", "PowerShell Invoke-RestMethod", "invoke-restmethod"),
+    (r"\btelnet\s+", "telnet command", "telnet"),
 ]
 
 # Telemetry/analytics patterns (always blocked)
 TELEMETRY_PATTERNS = [
-    (r"https?://[^'\"\s]*(?:posthog|segment|amplitude|mixpanel)[^'\"\s]*", "Analytics service URL"),
-    (r"https?://[^'\"\s]*(?:sentry\.io|bugsnag|rollbar)[^'\"\s]*", "Error tracking URL"),
-    (r"https?://[^'\"\s]*(?:analytics|telemetry|tracking|metrics|beacon)[^'\"\s]*", "Analytics/telemetry URL"),
-    (r"(?i)posthog\.capture", "PostHog tracking call"),
-    (r"(?i)analytics\.track", "Analytics tracking call"),
-    (r"(?i)Sentry\.init", "Sentry initialization"),
+    # URL bodies stop at the next scheme: a URL chaining many http:// would
+    # otherwise rescan to its end from each one (quadratic backtracking)
+    (r"https?://(?:(?!https?://)[^'\"\s])*?(?:posthog|segment|amplitude|mixpanel)[^'\"\s]*", "Analytics service URL", "http"),
+    (r"https?://(?:(?!https?://)[^'\"\s])*?(?:sentry\.io|bugsnag|rollbar)[^'\"\s]*", "Error tracking URL", "http"),
+    (r"https?://(?:(?!https?://)[^'\"\s])*?(?:analytics|telemetry|tracking|metrics|beacon)[^'\"\s]*", "Analytics/telemetry URL", "http"),
+    (r"(?i)posthog\.capture", "PostHog tracking call", "posthog.capture"),
+    (r"(?i)analytics\.track", "Analytics tracking call", "analytics.track"),
+    (r"(?i)Sentry\.init", "Sentry initialization", "sentry.init"),
 ]
 
+
+PatternList = List[Tuple["re.Pattern[str]", str]]
+
+
+# Lowercase literal every match of a pattern contains; checked with a plain
+# substring test before running the pattern on a line
+PATTERN_LITERALS: Dict["re.Pattern[str]", str] = {}
+
+
+def _compile_patterns(patterns: List[Tuple[str, str, str]]) -> PatternList:
+    """
+    Compile (regex, name, literal) triples once at import; inline (?i) flags
+    carry over. Literals go to PATTERN_LITERALS, keyed by compiled pattern.
+    """
+    compiled: PatternList = []
+    for pattern, name, literal in patterns:
+        regex = re.compile(pattern)
+        PATTERN_LITERALS[regex] = literal
+        compiled.append((regex, name))
+    return compiled
+
+
+SECRET_PATTERNS = _compile_patterns(SECRET_PATTERNS)
+NETWORK_CODE_PATTERNS = _compile_patterns(NETWORK_CODE_PATTERNS)
+SHELL_NETWORK_PATTERNS = _compile_patterns(SHELL_NETWORK_PATTERNS)
+TELEMETRY_PATTERNS = _compile_patterns(TELEMETRY_PATTERNS)
+
 # Combined network patterns for general scanning
 NETWORK_PATTERNS = NETWORK_CODE_PATTERNS + SHELL_NETWORK_PATTERNS + TELEMETRY_PATTERNS
 
+# Let a finding from the fused scan be classified by its name alone
+SECRET_NAMES = frozenset(name for _, name in SECRET_PATTERNS)
+TELEMETRY_NAMES = frozenset(name for _, name in TELEMETRY_PATTERNS)
+
+
+# Anchors shared by many patterns; the gate factors each out into one group,
+# written as the value. Lines are scanned one at a time, so a line-start
+# prefix only needs to skip spaces and tabs: a plain ^\s* would also run on
+# through every following blank line, from every line start (quadratic)
+_GATE_PREFIXES = {r"^\s*": r"^[^\S\n]*", r"\b": r"\b"}
+
+
+@lru_cache(maxsize=None)
+def _combine_patterns(patterns: Tuple[Tuple["re.Pattern[str]", str], ...]) -> "re.Pattern[str]":
+    """
+    Merge patterns into one alternation, compiled once per distinct list.
+    A single search tells whether any of them can match, so clean text costs
+    one regex call. MULTILINE keeps ^ anchored at line starts when searching
+    a whole file.
+
+    Alternatives sharing a leading anchor from _GATE_PREFIXES (line-start
+    imports, word-bounded shell commands such as curl/wget) are grouped
+    behind a single copy of it: re has no literal-set matcher, so this lets
+    most positions reject the whole group with one cheap check instead of
+    one per pattern.
+    """
+    grouped: Dict[str, List[str]] = {prefix: [] for prefix in _GATE_PREFIXES}
+    parts = []
+    for pattern, _ in patterns:
+        source = pattern.pattern
+        # Global inline flags are only allowed at the start; scope them instead
+        if source.startswith("(?i)"):
+            source = f"(?i:{source[4:]})"
+        for prefix in _GATE_PREFIXES:
+            if source.startswith(prefix):
+                grouped[prefix].append(f"(?:{source[len(prefix):]})")
+                break
+        else:
+            parts.append(f"(?:{source})")
+    for prefix, rests in grouped.items():
+        if rests:
+            parts.append(_GATE_PREFIXES[prefix] + "(?:" + "|".join(rests) + ")")
+    return re.compile("|".join(parts), re.MULTILINE)
+
+
+# Whole-line comments (#, //, * continuation); the scanners never report these
+COMMENT_LINE_RE = re.compile(r"^[^\S\n]*(?:#|//|\*).*", re.MULTILINE)
+
+# Host part of the first URL on a line, for detected-domain reporting
+URL_HOST_RE = re.compile(r"https?://([^/\s'\"]+)")
+
 # Files to scan for security issues
-SCANNABLE_EXTENSIONS = {".py", ".js", ".ts", ".sh", ".bash", ".zsh", ".rb", ".go", ".rs", ".ps1"}
+SCANNABLE_EXTENSIONS = frozenset({".py", ".js", ".ts", ".sh", ".bash", ".zsh", ".rb", ".go", ".rs", ".ps1"})
+
+# Top-level dirs whose files the security scan reads
+SCANNED_CONTENT_DIRS = frozenset(POSSIBLE_CONTENT_DIRS)
 
 # =========================
 # CVE SCANNING SETTINGS
@@ -192,10 +310,21 @@ class PluginResult:
     detected_domains: Set[str] = field(default_factory=set)
 
 
-def run(cmd: List[str], cwd: Optional[Path] = None) -> Tuple[int, str]:
-    p = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
-    out = (p.stdout or "") + (p.stderr or "")
-    return p.returncode, out.strip()
+def run(cmd: List[str], cwd: Optional[Path] = None, keep_output: bool = True) -> Tuple[int, str]:
+    """
+    Run a command, returning (returncode, combined stdout+stderr).
+    With keep_output=False stdout is discarded and only the tail of stderr
+    is decoded when the command fails (for error messages); on success ""
+    is returned.
+    """
+    if keep_output:
+        p = subprocess.run(cmd, cwd=cwd, capture_output=True, env=GIT_ENV)
+        out = (p.stdout + p.stderr).decode("utf-8", "replace")
+        return p.returncode, out.strip()
+    p = subprocess.run(cmd, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=GIT_ENV)
+    if p.returncode == 0:
+        return 0, ""
+    return p.returncode, p.stderr[-ERROR_OUTPUT_TAIL_BYTES:].decode("utf-8", "replace").strip()
 
 
 def fail(msg: str) -> None:
@@ -206,26 +335,115 @@ def fail(msg: str) -> None:
 def load_marketplace() -> dict:
     if not MARKETPLACE_FILE.exists():
         fail(f"Marketplace index not found: {MARKETPLACE_FILE}")
-    with MARKETPLACE_FILE.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return json_loads(MARKETPLACE_FILE.read_bytes())
+
+
+def clone_dir(name: str) -> Path:
+    """Clone directory for a plugin; stable across runs so it can be reused."""
+    return TMP_DIR / name.replace("/", "_").replace(":", "_")
 
 
-def ensure_tmp() -> None:
-    if TMP_DIR.exists():
-        shutil.rmtree(TMP_DIR)
+def _remove_trees(paths: List[Path]) -> None:
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def ensure_tmp(keep: Set[Path]) -> None:
+    """
+    Create TMP_DIR, dropping leftover clones that no current plugin will reuse.
+    No plugin clones into a stale dir, so it is deleted on a daemon thread
+    while validation runs; whatever is left at exit goes on the next run.
+    """
     TMP_DIR.mkdir(parents=True, exist_ok=True)
+    stale = [entry for entry in TMP_DIR.iterdir() if entry not in keep]
+    if stale:
+        threading.Thread(target=_remove_trees, args=(stale,), daemon=True).start()
+
+
+def _sparse_exclude(path: str) -> str:
+    """Sparse-checkout pattern that excludes exactly one repo-relative path."""
+    return "!/" + SPARSE_SPECIAL_RE.sub(r"\\\1", path)
 
 
-def cleanup_tmp() -> None:
-    if TMP_DIR.exists():
-        shutil.rmtree(TMP_DIR)
+def in_skipped_dir(path: str) -> bool:
+    """True if a repo-relative "/"-separated path lies under one of SKIP_DIRS."""
+    return any(part in SKIP_DIRS for part in path.split("/")[:-1])
 
 
-def clone_repo(url: str, dest: Path) -> Tuple[bool, str]:
-    code, out = run(["git", "clone", "--depth", "1", url, str(dest)])
+def clone_repo(url: str, dest: Path) -> Tuple[bool, str, List[Tuple[str, int]]]:
+    """
+    Shallow partial clone that never downloads blobs over MAX_FILE_SIZE_BYTES.
+    Such files fail validation on size alone, so they are left out of the
+    checkout and returned as (repo-relative path, size) for the caller to
+    report; those under SKIP_DIRS are left out but not returned.
+
+    An existing clone of the same URL in dest (from a previous run) is
+    updated with fetch + reset + clean instead of being cloned again; if
+    that fails (history rewritten past the shallow base, a damaged .git),
+    it is replaced by a fresh clone.
+    """
+    git = ["git", "-C", str(dest)]
+    reuse = (dest / ".git").is_dir() and run(git + ["config", "--get", "remote.origin.url"]) == (0, url)
+    if reuse:
+        ok, error, oversized = _checkout(url, dest, reuse=True)
+        if ok:
+            return ok, error, oversized
+    return _checkout(url, dest, reuse=False)
+
+
+def _checkout(url: str, dest: Path, reuse: bool) -> Tuple[bool, str, List[Tuple[str, int]]]:
+    """clone_repo() for one strategy: update the clone in dest, or clone afresh."""
+    git = ["git", "-C", str(dest)]
+    if reuse:
+        code, out = run(git + [
+            "fetch", "-q", "--depth", "1", "--no-tags",
+            f"--filter=blob:limit={MAX_FILE_SIZE_BYTES}", "origin", "HEAD"
+        ], keep_output=False)
+        rev = "FETCH_HEAD"
+    else:
+        shutil.rmtree(dest, ignore_errors=True)
+        code, out = run([
+            "git", "clone", "-q", "--depth", "1", "--single-branch", "--no-tags",
+            f"--filter=blob:limit={MAX_FILE_SIZE_BYTES}", "--no-checkout", url, str(dest)
+        ], keep_output=False)
+        rev = "HEAD"
+    if code != 0:
+        return False, f"Could not clone {url}: {out}", []
+
+    # Blobs the filter withheld; empty when the server ignores --filter
+    code, out = run(git + ["rev-list", "--objects", "--missing=print", rev])
+    missing = {line[1:] for line in out.splitlines() if line.startswith("?")}
+
+    withheld: List[Tuple[str, int]] = []
+    if missing:
+        code, out = run(git + ["ls-tree", "-r", "-l", "-z", rev])
+        for record in out.split("\0"):
+            meta, _, path = record.partition("\t")
+            if meta:
+                _, _, obj, size = meta.split()
+                if obj in missing:
+                    withheld.append((path, int(size)))
+    # Like the walk, ignore anything under SKIP_DIRS (dist/, node_modules/, ...)
+    oversized = [(path, size) for path, size in withheld if not in_skipped_dir(path)]
+
+    # Patterns are written before the reset so it never lazily fetches an
+    # excluded blob; a reused clone always rewrites them to drop stale ones
+    if withheld or reuse:
+        info = dest / ".git" / "info"
+        info.mkdir(exist_ok=True)
+        patterns = ["/*", *(_sparse_exclude(path) for path, _ in withheld)]
+        (info / "sparse-checkout").write_text("\n".join(patterns) + "\n", encoding="utf-8")
+        code, out = run(git + ["config", "core.sparseCheckout", "true"], keep_output=False)
+        if code != 0:
+            return False, f"Could not configure checkout for {url}: {out}", []
+
+    code, out = run(git + ["reset", "-q", "--hard", rev], keep_output=False)
+    if code == 0 and reuse:
+        # Drop anything a previous run left behind (e.g. npm lockfiles)
+        code, out = run(git + ["clean", "-q", "-fdx"], keep_output=False)
     if code != 0:
-        return False, f"Could not clone {url}: {out}"
-    return True, ""
+        return False, f"Could not check out {url}: {out}", []
+    return True, "", oversized
 
 
 # =========================
@@ -235,7 +453,7 @@ def clone_repo(url: str, dest: Path) -> Tuple[bool, str]:
 def check_tool_available(tool: str) -> bool:
     """Check if a CLI tool is available."""
     try:
-        code, _ = run(["which", tool])
+        code, _ = run(["which", tool], keep_output=False)
         return code == 0
     except Exception:
         return False
@@ -341,7 +559,7 @@ def scan_npm_cves(repo_path: Path, tier: str) -> Tuple[List[str], List[str]]:
     pkg_lock = repo_path / "package-lock.json"
     if not pkg_lock.exists():
         # Try to generate lock file
-        run(["npm", "install", "--package-lock-only", "--ignore-scripts"], cwd=repo_path)
+        run(["npm", "install", "--package-lock-only", "--ignore-scripts"], cwd=repo_path, keep_output=False)
 
     if not pkg_lock.exists():
         warnings.append("CVE SCAN: Could not generate package-lock.json, skipping npm audit")
@@ -411,46 +629,85 @@ def scan_dependencies_for_cves(repo_path: Path, tier: str) -> Tuple[List[str], L
     return all_errors, all_warnings
 
 
-def exists_any(repo_path: Path, paths: List[str]) -> Optional[str]:
+def list_root(repo_path: Path) -> Set[str]:
+    """Names at the repo root that exist (a symlink only when its target does)."""
+    with os.scandir(repo_path) as it:
+        return {e.name for e in it if not e.is_symlink() or os.path.exists(e.path)}
+
+
+def exists_any(repo_path: Path, paths: List[str], root: Set[str]) -> Optional[str]:
+    """First of `paths` that exists; `root` is list_root(repo_path)."""
     for p in paths:
-        if (repo_path / p).exists():
+        top, sep, _ = p.partition("/")
+        if top in root and (not sep or (repo_path / p).exists()):
             return p
     return None
 
 
-def is_probably_binary(path: Path) -> bool:
+# Printable ASCII plus tab/LF/CR; deleting these leaves only non-printable bytes
+_PRINTABLE_BYTES = bytes([9, 10, 13, *range(32, 127)])
+
+
+def is_probably_binary(path: str) -> bool:
     try:
-        with path.open("rb") as f:
+        # Unbuffered: one read() of the head, no buffer object to allocate
+        with open(path, "rb", buffering=0) as f:
             chunk = f.read(MAX_READ_BYTES_FOR_BINARY_CHECK)
         if b"\x00" in chunk:
             return True
-        printable = set(range(32, 127)) | {9, 10, 13}
         if not chunk:
             return False
-        non_printable = sum(1 for b in chunk if b not in printable)
+        non_printable = len(chunk.translate(None, _PRINTABLE_BYTES))
         ratio = non_printable / max(1, len(chunk))
         return ratio > 0.35
     except Exception:
         return True
 
 
-def walk_repo_files(repo_path: Path) -> List[Path]:
-    files: List[Path] = []
-    for root, dirs, filenames in os.walk(repo_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        for fn in filenames:
-            files.append(Path(root) / fn)
-    return files
+class FileInfo(NamedTuple):
+    """One file found by walk_repo_files(), with everything the checks need."""
+    path: str          # absolute
+    rel: str           # relative to the repo root
+    ext: str           # lowercased suffix, "" if none
+    size: int          # lstat size; a symlink counts as the link itself
+    is_symlink: bool
 
 
-def get_repo_size_bytes(files: List[Path]) -> int:
-    total = 0
-    for f in files:
-        try:
-            total += f.stat().st_size
-        except Exception:
-            continue
-    return total
+def walk_repo_files(repo_path: Path) -> Iterator[FileInfo]:
+    """
+    Yield every non-directory entry under repo_path in os.walk order, pruning
+    SKIP_DIRS. Symlinks (including ones to directories) are yielded, never
+    followed. Each entry is lstat'ed exactly once, here.
+    """
+    root = str(repo_path)
+    yield from _walk_dir(root, len(os.path.join(root, "")))
+
+
+def _walk_dir(path: str, prefix_len: int) -> Iterator[FileInfo]:
+    subdirs: List[str] = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    subdirs.append(entry.path)
+                continue
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue  # removed since it was listed
+            yield FileInfo(
+                entry.path,
+                entry.path[prefix_len:],
+                os.path.splitext(entry.name)[1].lower(),
+                st.st_size,
+                stat.S_ISLNK(st.st_mode),
+            )
+    for d in subdirs:
+        yield from _walk_dir(d, prefix_len)
+
+
+def get_repo_size_bytes(files: List[FileInfo]) -> int:
+    return sum(f.size for f in files)
 
 
 # =========================
@@ -562,11 +819,11 @@ def validate_plugin_manifest_schema(manifest: dict, tier: str) -> Tuple[List[str
                         for d in domains:
                             if not isinstance(d, str):
                                 errors.append(f"domain must be string: {d}")
-                            elif not DOMAIN_RE.match(d):
+                                continue
+                            match = DOMAIN_RE.match(d)
+                            if not match:
                                 errors.append(f"invalid domain format (no wildcards, no IPs, no protocols): '{d}'")
-                            elif d.startswith("*."):
-                                errors.append(f"wildcard domains not allowed: '{d}'")
-                            elif re.match(r"^\d+\.\d+\.\d+\.\d+$", d):
+                            elif match.group("ipv4"):
                                 errors.append(f"IP addresses not allowed as domains: '{d}'")
                 elif mode == "none" and domains:
                     errors.append("manifest.capabilities.network.domains should not be present when mode is 'none'")
@@ -587,51 +844,70 @@ def validate_plugin_manifest_schema(manifest: dict, tier: str) -> Tuple[List[str
     return errors, warnings
 
 
-def validate_tier_policy(manifest: dict, tier: str, is_legacy: bool = False) -> List[str]:
-    """Enforce tier-specific policy rules."""
+def _curated_policy(manifest: dict, network: dict, mode: str) -> List[str]:
     errors = []
 
-    # For legacy manifests, assume network.mode='none' (curated default)
-    caps = manifest.get("capabilities", {})
-    network = caps.get("network", {}) if caps else {}
-    mode = network.get("mode", "none") if network else "none"
+    # Curated plugins must have network.mode = "none"
+    if mode != "none":
+        errors.append(
+            f"TIER POLICY: curated plugins must have capabilities.network.mode='none', "
+            f"found '{mode}'. Remove network access or move to community tier."
+        )
 
-    if tier == "curated":
-        # Curated plugins must have network.mode = "none"
-        if mode != "none":
-            errors.append(
-                f"TIER POLICY: curated plugins must have capabilities.network.mode='none', "
-                f"found '{mode}'. Remove network access or move to community tier."
-            )
+    # Curated plugins should not have risk metadata (or it should be low)
+    risk = manifest.get("risk", {})
+    if risk and risk.get("dataEgress") in ["medium", "high"]:
+        errors.append(
+            f"TIER POLICY: curated plugins cannot have medium/high risk. "
+            f"Found risk.dataEgress='{risk.get('dataEgress')}'"
+        )
+
+    return errors
 
-        # Curated plugins should not have risk metadata (or it should be low)
-        risk = manifest.get("risk", {})
-        if risk and risk.get("dataEgress") in ["medium", "high"]:
-            errors.append(
-                f"TIER POLICY: curated plugins cannot have medium/high risk. "
-                f"Found risk.dataEgress='{risk.get('dataEgress')}'"
-            )
 
-    elif tier == "community":
-        # Community plugins with network must use allowlist
-        if mode not in ["none", "allowlist"]:
+def _community_policy(manifest: dict, network: dict, mode: str) -> List[str]:
+    errors = []
+
+    # Community plugins with network must use allowlist
+    if mode not in ["none", "allowlist"]:
+        errors.append(
+            f"TIER POLICY: community plugins must use network.mode='none' or 'allowlist', "
+            f"found '{mode}'"
+        )
+
+    # If allowlist, domains must be specified
+    if mode == "allowlist":
+        domains = network.get("domains", [])
+        if not domains:
             errors.append(
-                f"TIER POLICY: community plugins must use network.mode='none' or 'allowlist', "
-                f"found '{mode}'"
+                "TIER POLICY: community plugins with network.mode='allowlist' must "
+                "declare explicit domains in capabilities.network.domains"
             )
 
-        # If allowlist, domains must be specified
-        if mode == "allowlist":
-            domains = network.get("domains", [])
-            if not domains:
-                errors.append(
-                    "TIER POLICY: community plugins with network.mode='allowlist' must "
-                    "declare explicit domains in capabilities.network.domains"
-                )
-
     return errors
 
 
+# Per-tier policy checks; a new tier only needs an entry here
+TIER_POLICIES = {
+    "curated": _curated_policy,
+    "community": _community_policy,
+}
+
+
+def validate_tier_policy(manifest: dict, tier: str, is_legacy: bool = False) -> List[str]:
+    """Enforce tier-specific policy rules."""
+    policy = TIER_POLICIES.get(tier)
+    if policy is None:
+        return []
+
+    # For legacy manifests, assume network.mode='none' (curated default)
+    caps = manifest.get("capabilities", {})
+    network = caps.get("network", {}) if caps else {}
+    mode = network.get("mode", "none") if network else "none"
+
+    return policy(manifest, network, mode)
+
+
 # =========================
 # MARKETPLACE ENTRY PARSING
 # =========================
@@ -688,24 +964,70 @@ def parse_plugin_entry(plugin: dict) -> Tuple[Optional[str], Optional[str], Opti
 # SECURITY SCANNING
 # =========================
 
+def strip_comment_lines(content: str) -> str:
+    """Blank out comment lines, keeping every newline so line numbers hold."""
+    return COMMENT_LINE_RE.sub("", content)
+
+
+def _scan_content(content: str, patterns: PatternList) -> Iterator[Tuple[int, str, "re.Match[str]"]]:
+    """
+    Yield (line_num, name, match) for every pattern hit on a non-comment line.
+    A combined gate regex searches the whole content, so only lines it lands
+    on are split out and checked against the individual patterns; of those,
+    only patterns whose literal occurs in the line are run.
+    """
+    gate = _combine_patterns(tuple(patterns))
+    line_num = 1
+    line_start = 0
+    pos = 0
+    while True:
+        hit = gate.search(content, pos)
+        if not hit:
+            return
+        start = content.rfind("\n", 0, hit.start()) + 1
+        line_num += content.count("\n", line_start, start)
+        line_start = start
+        end = content.find("\n", start)
+        if end == -1:
+            end = len(content)
+        line = content[start:end]
+
+        if not line.lstrip().startswith(("#", "//", "*")):
+            # Same ASCII-only caveat as _may_contain_secret for (?i) folding
+            lowered = line.lower() if line.isascii() else None
+            for pattern, name in patterns:
+                literal = PATTERN_LITERALS.get(pattern)
+                if literal and lowered is not None and literal not in lowered:
+                    continue
+                match = pattern.search(line)
+                if match:
+                    yield line_num, name, match
+        pos = end + 1
+
+
+def _may_contain_secret(content: str) -> bool:
+    """
+    Cheap keyword check before the regex scan. Only trusted for ASCII text:
+    (?i) also folds some non-ASCII letters (e.g. the long s) that lower()
+    leaves alone, so anything else always gets the full scan.
+    """
+    if not content.isascii():
+        return True
+    lowered = content.lower()
+    return any(k in lowered for k in SECRET_KEYWORDS)
+
+
 def scan_file_for_secrets(file_path: Path, content: str) -> List[Tuple[int, str, str]]:
     """Scan file content for hardcoded secrets."""
     findings: List[Tuple[int, str, str]] = []
-    lines = content.split("\n")
-
-    for line_num, line in enumerate(lines, 1):
-        stripped = line.strip()
-        if stripped.startswith("#") or stripped.startswith("//") or stripped.startswith("*"):
-            continue
+    if not _may_contain_secret(content):
+        return findings
 
-        for pattern, name in SECRET_PATTERNS:
-            if re.search(pattern, line):
-                match = re.search(pattern, line)
-                if match:
-                    matched = match.group(0)
-                    if len(matched) > 20:
-                        matched = matched[:8] + "..." + matched[-4:]
-                    findings.append((line_num, name, matched))
+    for line_num, name, match in _scan_content(content, SECRET_PATTERNS):
+        matched = match.group(0)
+        if len(matched) > 20:
+            matched = matched[:8] + "..." + matched[-4:]
+        findings.append((line_num, name, matched))
 
     return findings
 
@@ -713,19 +1035,10 @@ def scan_file_for_secrets(file_path: Path, content: str) -> List[Tuple[int, str,
 def scan_file_for_network(file_path: Path, content: str) -> List[Tuple[int, str, str]]:
     """Scan file content for network/telemetry code."""
     findings: List[Tuple[int, str, str]] = []
-    lines = content.split("\n")
 
-    for line_num, line in enumerate(lines, 1):
-        stripped = line.strip()
-        if stripped.startswith("#") or stripped.startswith("//") or stripped.startswith("*"):
-            continue
-
-        for pattern, name in NETWORK_PATTERNS:
-            if re.search(pattern, line):
-                match = re.search(pattern, line)
-                if match:
-                    matched = match.group(0)[:50]
-                    findings.append((line_num, name, matched))
+    for line_num, name, match in _scan_content(content, NETWORK_PATTERNS):
+        matched = match.group(0)[:50]
+        findings.append((line_num, name, matched))
 
     return findings
 
@@ -733,26 +1046,109 @@ def scan_file_for_network(file_path: Path, content: str) -> List[Tuple[int, str,
 def scan_file_for_telemetry(file_path: Path, content: str) -> List[Tuple[int, str, str]]:
     """Scan specifically for telemetry/analytics (always blocked)."""
     findings: List[Tuple[int, str, str]] = []
-    lines = content.split("\n")
-
-    for line_num, line in enumerate(lines, 1):
-        stripped = line.strip()
-        if stripped.startswith("#") or stripped.startswith("//") or stripped.startswith("*"):
-            continue
 
-        for pattern, name in TELEMETRY_PATTERNS:
-            if re.search(pattern, line):
-                match = re.search(pattern, line)
-                if match:
-                    matched = match.group(0)[:50]
-                    findings.append((line_num, name, matched))
+    for line_num, name, match in _scan_content(content, TELEMETRY_PATTERNS):
+        matched = match.group(0)[:50]
+        findings.append((line_num, name, matched))
 
     return findings
 
 
+def scan_file(
+    file_path: Path, content: str
+) -> Tuple[List[Tuple[int, str, str]], List[Tuple[int, str, str]], List[Tuple[int, str, str]]]:
+    """
+    Single pass over content for all three scans.
+    Returns (secrets, network, telemetry) findings, the same as calling
+    scan_file_for_secrets/_network/_telemetry separately.
+    """
+    secrets: List[Tuple[int, str, str]] = []
+    network: List[Tuple[int, str, str]] = []
+
+    patterns = NETWORK_PATTERNS
+    if _may_contain_secret(content):
+        patterns = SECRET_PATTERNS + NETWORK_PATTERNS
+
+    for line_num, name, match in _scan_content(content, patterns):
+        matched = match.group(0)
+        if name in SECRET_NAMES:
+            if len(matched) > 20:
+                matched = matched[:8] + "..." + matched[-4:]
+            secrets.append((line_num, name, matched))
+        else:
+            network.append((line_num, name, matched[:50]))
+
+    telemetry = [f for f in network if f[1] in TELEMETRY_NAMES]
+    return secrets, network, telemetry
+
+
+def _lines_at(content: str, line_nums: Set[int]) -> Iterator[str]:
+    """
+    Yield the given 1-based lines of content in ascending order. Only those
+    lines are sliced out, so the file is never split into a full line list.
+    """
+    line_num = 1
+    start = 0
+    for n in sorted(line_nums):
+        while line_num < n:
+            start = content.index("\n", start) + 1
+            line_num += 1
+        end = content.find("\n", start)
+        yield content[start:] if end == -1 else content[start:end]
+
+
+def _scan_path(path: Path) -> Tuple[
+    List[Tuple[int, str, str]], List[Tuple[int, str, str]], List[Tuple[int, str, str]], Set[str]
+]:
+    """
+    Read and scan one file. Returns scan_file()'s findings plus the hosts of
+    URLs on lines flagged as (non-telemetry) network code. Module-level so
+    the scan process pool can run it.
+    """
+    # Strip once up front so the scan never stops on comments
+    content = strip_comment_lines(path.read_text(encoding="utf-8", errors="ignore"))
+    secrets, network, telemetry = scan_file(path, content)
+
+    # Extract domains from URLs on the flagged lines
+    flagged = {n for n, name, _ in network if name not in TELEMETRY_NAMES}
+    hosts = (URL_HOST_RE.search(line) for line in _lines_at(content, flagged))
+    return secrets, network, telemetry, {m.group(1) for m in hosts if m}
+
+
+_scan_executor: Optional[ProcessPoolExecutor] = None
+_scan_executor_lock = threading.Lock()
+
+
+def _scan_pool() -> ProcessPoolExecutor:
+    """
+    Process pool shared by all plugins; regex scanning is CPU-bound and holds
+    the GIL. Workers are spawned, not forked, since plugin threads are live.
+    Created under a lock, as plugin threads may ask for it at the same time.
+    """
+    global _scan_executor
+    with _scan_executor_lock:
+        if _scan_executor is None:
+            _scan_executor = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+        return _scan_executor
+
+
+def _pooled_scan(future: Future, path: Path) -> Tuple[
+    List[Tuple[int, str, str]], List[Tuple[int, str, str]], List[Tuple[int, str, str]], Set[str]
+]:
+    """
+    Result of a _scan_path() run in the pool. If the pool broke (e.g. a
+    worker was OOM-killed) the file is scanned in-process instead, so it
+    never goes unscanned.
+    """
+    try:
+        return future.result()
+    except BrokenExecutor:
+        return _scan_path(path)
+
+
 def security_scan_repo(
     repo_path: Path,
-    files: List[Path],
+    files: List[FileInfo],
     tier: str,
     allowed_domains: Set[str]
 ) -> Tuple[List[str], List[str], bool, Set[str]]:
@@ -765,48 +1161,47 @@ def security_scan_repo(
     network_detected = False
     detected_domains: Set[str] = set()
 
-    content_dirs = {"commands", "hooks", "agents", "skills"}
-
-    for f in files:
-        if f.suffix.lower() not in SCANNABLE_EXTENSIONS:
-            continue
+    targets = [
+        f for f in files
+        if f.ext in SCANNABLE_EXTENSIONS and f.rel.split(os.sep, 1)[0] in SCANNED_CONTENT_DIRS
+    ]
 
+    # Small repos aren't worth the inter-process round trips
+    scans = [partial(_scan_path, Path(f.path)) for f in targets]
+    if len(targets) >= MIN_FILES_FOR_SCAN_POOL:
         try:
-            rel_parts = f.relative_to(repo_path).parts
-            if not rel_parts or rel_parts[0] not in content_dirs:
-                continue
-        except ValueError:
-            continue
-
+            pool = _scan_pool()
+            scans = [
+                partial(_pooled_scan, pool.submit(_scan_path, path), path)
+                for path in (Path(f.path) for f in targets)
+            ]
+        except BrokenExecutor:
+            pass  # a pool broken by an earlier plugin; scan in-process
+
+    for f, scan in zip(targets, scans):
+        rel = f.rel
         try:
-            content = f.read_text(encoding="utf-8", errors="ignore")
-            rel = f.relative_to(repo_path)
+            secret_findings, network_findings, telemetry_findings, hosts = scan()
 
             # Check for secrets (HARD FAIL for all tiers)
-            secret_findings = scan_file_for_secrets(f, content)
             for line_num, name, matched in secret_findings:
                 errors.append(
                     f"SECURITY: Hardcoded secret detected & rejected by validator in {rel}:{line_num} - {name}"
                 )
 
             # Check for telemetry (HARD FAIL for all tiers)
-            telemetry_findings = scan_file_for_telemetry(f, content)
             for line_num, name, matched in telemetry_findings:
                 errors.append(
                     f"SECURITY: Telemetry/analytics detected & rejected by validator in {rel}:{line_num} - {name}"
                 )
 
             # Check for network code
-            network_findings = scan_file_for_network(f, content)
             if network_findings:
                 network_detected = True
 
                 for line_num, name, matched in network_findings:
                     # Skip if it's a telemetry finding (already handled above)
-                    is_telemetry = any(
-                        re.search(tp[0], matched) for tp in TELEMETRY_PATTERNS
-                    )
-                    if is_telemetry:
+                    if name in TELEMETRY_NAMES:
                         continue
 
                     if tier == "curated":
@@ -822,13 +1217,10 @@ def security_scan_repo(
                             f"Ensure all accessed domains are declared in manifest."
                         )
 
-                    # Try to extract domains from URLs in the line
-                    url_match = re.search(r'https?://([^/\s\'"]+)', content.split("\n")[line_num - 1])
-                    if url_match:
-                        detected_domains.add(url_match.group(1))
+                detected_domains.update(hosts)
 
         except Exception as e:
-            warnings.append(f"Could not security scan {f.relative_to(repo_path)}: {e}")
+            warnings.append(f"Could not security scan {rel}: {e}")
 
     return errors, warnings, network_detected, detected_domains
 
@@ -871,43 +1263,49 @@ def check_consistency(
 # PLUGIN REPO VALIDATION
 # =========================
 
-def extract_command_names(repo_path: Path) -> Set[str]:
-    """Extract command names from commands directory."""
+def extract_command_names(files: List[FileInfo]) -> Set[str]:
+    """Extract command names from the already-walked files under commands/."""
     cmds: Set[str] = set()
-    cmd_dir = repo_path / "commands"
-    if not cmd_dir.exists() or not cmd_dir.is_dir():
-        return cmds
-
-    for f in cmd_dir.rglob("*"):
-        if f.is_file() and f.suffix.lower() in {".md", ".txt"}:
-            cmds.add(f.stem.strip())
+    prefix = "commands" + os.sep
+    for f in files:
+        if f.ext in {".md", ".txt"} and f.rel.startswith(prefix):
+            # A symlink only counts when it points at a regular file
+            if f.is_symlink and not os.path.isfile(f.path):
+                continue
+            cmds.add(os.path.splitext(os.path.basename(f.rel))[0].strip())
     return cmds
 
 
 def validate_plugin_repo(
     repo_path: Path,
-    tier: str
+    tier: str,
+    oversized: Optional[List[Tuple[str, int]]] = None
 ) -> Tuple[List[str], List[str], Set[str], Optional[dict], bool, Set[str]]:
     """
-    Validate a cloned plugin repository.
+    Validate a cloned plugin repository. `oversized` lists the tracked files
+    (path, size) the clone skipped for exceeding MAX_FILE_SIZE_BYTES.
     Returns (errors, warnings, commands, manifest, network_detected, detected_domains).
     """
+    oversized = oversized or []
     errors: List[str] = []
     warnings: List[str] = []
     manifest_data: Optional[dict] = None
 
+    # One listing of the repo root answers the existence checks below
+    root = list_root(repo_path)
+
     # Required: manifest exists
-    manifest = exists_any(repo_path, POSSIBLE_PLUGIN_MANIFESTS)
+    manifest = exists_any(repo_path, POSSIBLE_PLUGIN_MANIFESTS, root)
     if not manifest:
         errors.append(f"Missing plugin manifest (expected one of: {POSSIBLE_PLUGIN_MANIFESTS})")
 
     # Required: README + LICENSE
     for f in REQUIRED_FILES:
-        if not (repo_path / f).exists():
+        if f not in root:
             errors.append(f"Missing required file: {f}")
 
     # Required: content dirs
-    has_content = any((repo_path / d).exists() for d in POSSIBLE_CONTENT_DIRS)
+    has_content = any(d in root for d in POSSIBLE_CONTENT_DIRS)
     if not has_content:
         errors.append(f"No content dirs found (expected one of: {POSSIBLE_CONTENT_DIRS})")
 
@@ -916,7 +1314,7 @@ def validate_plugin_repo(
     is_legacy = False
     if manifest:
         try:
-            manifest_data = json.loads((repo_path / manifest).read_text(encoding="utf-8"))
+            manifest_data = json_loads((repo_path / manifest).read_bytes())
 
             # Validate manifest schema (returns errors, warnings)
             schema_errors, schema_warnings = validate_plugin_manifest_schema(manifest_data, tier)
@@ -941,45 +1339,71 @@ def validate_plugin_repo(
         except Exception as e:
             errors.append(f"Error reading {manifest}: {e}")
 
-    # Deep scan: file sizes, binaries, repo size
-    files = walk_repo_files(repo_path)
+    # Deep scan: file sizes, binaries, repo size. Files past MAX_FILES_COUNT
+    # are only counted and sized, never kept or inspected
+    walker = walk_repo_files(repo_path)
+    entries = list(islice(walker, max(MAX_FILES_COUNT - len(oversized), 0)))
+    file_count = len(entries) + len(oversized)
+    repo_size = get_repo_size_bytes(entries) + sum(size for _, size in oversized)
+    for f in walker:
+        file_count += 1
+        repo_size += f.size
 
-    if len(files) > MAX_FILES_COUNT:
-        errors.append(f"Repo contains too many files: {len(files)} > {MAX_FILES_COUNT}")
+    too_many_files = file_count > MAX_FILES_COUNT
+    if too_many_files:
+        errors.append(f"Repo contains too many files: {file_count} > {MAX_FILES_COUNT}")
 
-    repo_size = get_repo_size_bytes(files)
     if repo_size > MAX_REPO_SIZE_BYTES:
         errors.append(
             f"Repo too large: {repo_size/1024/1024:.2f}MB > {MAX_REPO_SIZE_BYTES/1024/1024:.2f}MB"
         )
 
-    for f in files:
+    for rel, _ in oversized:
+        errors.append(
+            f"File too large: {rel} (> {MAX_FILE_SIZE_BYTES/1024/1024:.2f}MB, not downloaded)"
+        )
+        ext = os.path.splitext(rel)[1].lower()
+        if ext in DISALLOWED_EXTENSIONS:
+            errors.append(f"Disallowed file type in repo: {rel} ({ext})")
+
+    # Already a hard fail; opening and scanning thousands of files would
+    # only delay the report
+    if too_many_files:
+        warnings.append("Skipped per-file, security and CVE checks (too many files)")
+        return errors, warnings, set(), manifest_data, False, set()
+
+    files: List[FileInfo] = []
+    for f in entries:
         try:
-            if f.is_symlink():
-                warnings.append(f"Symlink detected: {f.relative_to(repo_path)} (review manually)")
+            if f.is_symlink:
+                warnings.append(f"Symlink detected: {f.rel} (review manually)")
+                # Still scan what a link to a regular file would load
+                if (f.ext in SCANNABLE_EXTENSIONS and os.path.isfile(f.path)
+                        and os.path.getsize(f.path) <= MAX_FILE_SIZE_BYTES):
+                    files.append(f)
                 continue
 
-            size = f.stat().st_size
-            rel = f.relative_to(repo_path)
+            # Oversized files already fail below; scanning them would only
+            # pull an unbounded file into memory as one str
+            if f.ext in SCANNABLE_EXTENSIONS and f.size <= MAX_FILE_SIZE_BYTES:
+                files.append(f)
 
-            if size > MAX_FILE_SIZE_BYTES:
+            if f.size > MAX_FILE_SIZE_BYTES:
                 errors.append(
-                    f"File too large: {rel} ({size/1024/1024:.2f}MB) > {MAX_FILE_SIZE_BYTES/1024/1024:.2f}MB"
+                    f"File too large: {f.rel} ({f.size/1024/1024:.2f}MB) > {MAX_FILE_SIZE_BYTES/1024/1024:.2f}MB"
                 )
 
-            ext = f.suffix.lower()
-
-            if ext in DISALLOWED_EXTENSIONS:
-                errors.append(f"Disallowed file type in repo: {rel} ({ext})")
-
-            if ext not in TEXT_EXTENSIONS and size > 0:
-                if is_probably_binary(f):
-                    errors.append(f"Binary/suspicious file detected: {rel}")
+            # A disallowed extension already fails; don't open it for a binary sniff
+            if f.ext in DISALLOWED_EXTENSIONS:
+                errors.append(f"Disallowed file type in repo: {f.rel} ({f.ext})")
+            elif f.size > 0 and f.ext not in TEXT_EXTENSIONS:
+                if is_probably_binary(f.path):
+                    errors.append(f"Binary/suspicious file detected: {f.rel}")
 
         except Exception as e:
-            warnings.append(f"Could not inspect file: {f} ({e})")
+            warnings.append(f"Could not inspect file: {f.path} ({e})")
 
-    commands = extract_command_names(repo_path)
+    commands = extract_command_names(entries)
     if len(commands) == 0:
         warnings.append("No commands detected under commands/ (ok if plugin uses hooks/agents only)")
 
@@ -1003,6 +1427,67 @@ def validate_plugin_repo(
     return errors, warnings, commands, manifest_data, network_detected, detected_domains
 
 
+def cap_messages(messages: List[str]) -> List[str]:
+    """Keep the first MAX_MESSAGES_PER_CATEGORY messages and count the rest."""
+    dropped = len(messages) - MAX_MESSAGES_PER_CATEGORY
+    if dropped <= 0:
+        return messages
+    return messages[:MAX_MESSAGES_PER_CATEGORY] + [f"... {dropped} more suppressed"]
+
+
+def validate_plugin(idx: int, plugin: dict) -> Tuple[PluginResult, Set[str], List[str]]:
+    """
+    Clone and validate one marketplace entry.
+    Returns (result, command_names, log_lines); nothing is printed so that
+    concurrent runs don't interleave.
+    """
+    log: List[str] = []
+    name, tier, url, entry_errors = parse_plugin_entry(plugin)
+
+    if entry_errors or not name or not tier or not url:
+        result = PluginResult(
+            name=name or f"plugin_{idx}",
+            tier=tier or "unknown",
+            url=url or "missing",
+            errors=entry_errors or ["Invalid marketplace entry"],
+        )
+        return result, set(), log
+
+    dest = clone_dir(name)
+
+    tier_badge = "🔒" if tier == "curated" else "🌐"
+    log.append(f"{tier_badge} Validating: {name} [{tier}] -> {url}")
+
+    result = PluginResult(name=name, tier=tier, url=url)
+    cmd_names: Set[str] = set()
+
+    success, clone_error, oversized = clone_repo(url, dest)
+    if not success:
+        result.errors.append(clone_error)
+        log.append(f"❌ FAIL: {name}")
+        return result, cmd_names, log
+
+    try:
+        repo_errors, repo_warnings, cmd_names, manifest, net_detected, det_domains = validate_plugin_repo(
+            dest, tier, oversized
+        )
+        result.errors.extend(cap_messages(repo_errors))
+        result.warnings.extend(cap_messages(repo_warnings))
+        result.network_detected = net_detected
+        result.detected_domains = det_domains
+
+        if result.errors:
+            log.append(f"❌ FAIL: {name}")
+        else:
+            log.append(f"✅ OK: {name}")
+
+    except Exception as e:
+        result.errors.append(f"Unhandled error: {e}")
+        log.append(f"❌ FAIL: {name}")
+
+    return result, cmd_names, log
+
+
 # =========================
 # MAIN
 # =========================
@@ -1023,64 +1508,21 @@ def main() -> int:
         print("✅ Marketplace validated (no plugins to check)")
         return 0
 
-    ensure_tmp()
+    # Plugin names are unique (checked above), so each gets its own clone dir
+    ensure_tmp({clone_dir(p["name"]) for p in plugins if isinstance(p.get("name"), str)})
 
     results: List[PluginResult] = []
     all_command_index: Dict[str, List[str]] = {}
 
-    for idx, plugin in enumerate(plugins):
-        name, tier, url, entry_errors = parse_plugin_entry(plugin)
-
-        if entry_errors or not name or not tier or not url:
-            results.append(
-                PluginResult(
-                    name=name or f"plugin_{idx}",
-                    tier=tier or "unknown",
-                    url=url or "missing",
-                    errors=entry_errors or ["Invalid marketplace entry"],
-                )
-            )
-            continue
-
-        safe_dir = name.replace("/", "_").replace(":", "_")
-        dest = TMP_DIR / safe_dir
-
-        tier_badge = "🔒" if tier == "curated" else "🌐"
-        print(f"{tier_badge} Validating: {name} [{tier}] -> {url}")
-
-        result = PluginResult(name=name, tier=tier, url=url)
-
-        success, clone_error = clone_repo(url, dest)
-        if not success:
-            result.errors.append(clone_error)
-            print(f"❌ FAIL: {name}")
-            results.append(result)
-            continue
-
-        try:
-            repo_errors, repo_warnings, cmd_names, manifest, net_detected, det_domains = validate_plugin_repo(
-                dest, tier
-            )
-            result.errors.extend(repo_errors)
-            result.warnings.extend(repo_warnings)
-            result.network_detected = net_detected
-            result.detected_domains = det_domains
-
+    # Clones and scans are independent; map() still yields in marketplace order
+    workers = min(MAX_PARALLEL_PLUGINS, len(plugins))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        for result, cmd_names, log in ex.map(validate_plugin, range(len(plugins)), plugins):
+            for line in log:
+                print(line)
             for c in cmd_names:
-                all_command_index.setdefault(c, []).append(name)
-
-            if result.errors:
-                print(f"❌ FAIL: {name}")
-            else:
-                print(f"✅ OK: {name}")
-
-        except Exception as e:
-            result.errors.append(f"Unhandled error: {e}")
-            print(f"❌ FAIL: {name}")
-
-        results.append(result)
-
-    cleanup_tmp()
+                all_command_index.setdefault(c, []).append(result.name)
+            results.append(result)
 
     # Cross-plugin command collision warnings
     collisions = {cmd: pls for cmd, pls in all_command_index.items() if len(pls) > 1}
@@ -1088,54 +1530,60 @@ def main() -> int:
     failed = [r for r in results if r.errors]
     passed = [r for r in results if not r.errors]
 
-    print("\n" + "=" * 60)
-    print("📦 Validation Report")
-    print("=" * 60 + "\n")
+    # The report is rendered into one buffer and written at once, so it is
+    # never interleaved with other output in CI logs
+    out = io.StringIO()
+    w = out.write
+
+    w("\n" + "=" * 60 + "\n")
+    w("📦 Validation Report\n")
+    w("=" * 60 + "\n\n")
 
     # Summary by tier
     curated_count = len([r for r in results if r.tier == "curated"])
     community_count = len([r for r in results if r.tier == "community"])
-    print(f"Plugins: {len(results)} total ({curated_count} curated, {community_count} community)\n")
+    w(f"Plugins: {len(results)} total ({curated_count} curated, {community_count} community)\n\n")
 
     for r in results:
         tier_badge = "🔒" if r.tier == "curated" else "🌐"
         status = "❌" if r.errors else "✅"
-        print(f"{status} {r.name} [{r.tier}] {tier_badge}")
-        print(f"   url: {r.url}")
+        w(f"{status} {r.name} [{r.tier}] {tier_badge}\n")
+        w(f"   url: {r.url}\n")
 
-        if r.errors:
-            for e in r.errors:
-                print(f"   ❌ {e}")
-        if r.warnings:
-            for w in r.warnings:
-                print(f"   ⚠️  {w}")
+        for e in r.errors:
+            w(f"   ❌ {e}\n")
+        for warning in r.warnings:
+            w(f"   ⚠️  {warning}\n")
 
         if r.tier == "community" and r.network_detected:
-            print(f"   📡 Network usage detected")
+            w("   📡 Network usage detected\n")
             if r.detected_domains:
-                print(f"   📡 Detected domains: {sorted(r.detected_domains)}")
+                w(f"   📡 Detected domains: {sorted(r.detected_domains)}\n")
 
-        print()
+        w("\n")
 
     if collisions:
-        print("⚠️  Command name collisions detected (warning only):")
+        w("⚠️  Command name collisions detected (warning only):\n")
         for cmd, pls in sorted(collisions.items(), key=lambda x: x[0]):
-            print(f"   - '{cmd}' appears in: {', '.join(pls)}")
-        print("   Note: Usually OK - Claude Code namespaces commands by plugin name.\n")
+            w(f"   - '{cmd}' appears in: {', '.join(pls)}\n")
+        w("   Note: Usually OK - Claude Code namespaces commands by plugin name.\n\n")
 
-    print("=" * 60)
-    print(f"✅ Passed: {len(passed)}")
-    print(f"❌ Failed: {len(failed)}")
-    print("=" * 60)
+    w("=" * 60 + "\n")
+    w(f"✅ Passed: {len(passed)}\n")
+    w(f"❌ Failed: {len(failed)}\n")
+    w("=" * 60 + "\n")
 
     if failed:
-        print("\n💡 Remediation hints:")
-        print("   - Secrets: Remove hardcoded credentials, use environment variables")
-        print("   - Network (curated): Remove network code or move plugin to community tier")
-        print("   - Network (community): Declare all domains in capabilities.network.domains")
-        print("   - Telemetry: Remove all analytics/tracking code (not allowed in any tier)")
-        print("   - Consistency: Ensure manifest matches actual code behavior")
-        print("   - CVE: Update vulnerable dependencies to patched versions")
+        w("\n💡 Remediation hints:\n")
+        w("   - Secrets: Remove hardcoded credentials, use environment variables\n")
+        w("   - Network (curated): Remove network code or move plugin to community tier\n")
+        w("   - Network (community): Declare all domains in capabilities.network.domains\n")
+        w("   - Telemetry: Remove all analytics/tracking code (not allowed in any tier)\n")
+        w("   - Consistency: Ensure manifest matches actual code behavior\n")
+        w("   - CVE: Update vulnerable dependencies to patched versions\n")
+
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
 
     return 1 if failed else 0
 